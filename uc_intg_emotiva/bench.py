@@ -0,0 +1,197 @@
+"""
+Benchmark notification ingest and command send on each event loop backend.
+
+Usage: python -m uc_intg_emotiva.bench [--loops asyncio,uvloop] [--count 5000] [--window 64]
+
+Both paths run over loopback UDP through the real client: ingest feeds
+notification datagrams to the listener and times them to the notify
+callback; command send times ``send_command`` to arrival at a local sink.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import time
+from typing import Any, Dict, List
+
+from uc_intg_emotiva import runtime
+from uc_intg_emotiva.client import EmotivaClient
+from uc_intg_emotiva.config import DeviceConfig
+from uc_intg_emotiva.replay import _percentile
+
+_LOG = logging.getLogger(__name__)
+
+NOTIFY_PAYLOADS = tuple(
+    (
+        '<?xml version="1.0" encoding="utf-8"?><emotivaNotify>'
+        f'<property name="volume" value="{volume}" visible="true"/>'
+        '<property name="audio_input" value="HDMI 1" visible="true"/>'
+        '</emotivaNotify>'
+    ).encode("utf-8")
+    for volume in ("-40.0", "-50.0")
+)
+
+
+class _Sink(asyncio.DatagramProtocol):
+
+    def __init__(self):
+        self.arrivals: List[float] = []
+        self.expected = 0
+        self.done = asyncio.Event()
+
+    def expect(self, count: int):
+        self.expected = len(self.arrivals) + count
+        self.done.clear()
+
+    def datagram_received(self, data: bytes, addr):
+        self.arrivals.append(time.perf_counter())
+        if len(self.arrivals) >= self.expected:
+            self.done.set()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _summary(count: int, elapsed: float, latencies: List[float]) -> Dict[str, Any]:
+    latencies.sort()
+    return {
+        "throughput_pps": count / elapsed if elapsed > 0 else 0.0,
+        "latency_us": {p: _percentile(latencies, p) * 1e6 for p in (50, 90, 99)},
+    }
+
+
+async def bench_ingest(count: int, window: int) -> Dict[str, Any]:
+    port = _free_port()
+    client = EmotivaClient(DeviceConfig(
+        device_id="bench", name="Bench", ip_address="127.0.0.1", model="XMC-2", notify_port=port,
+    ))
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.setblocking(False)
+    processed = 0
+    target = 0
+    sent = 0
+    last_update = 0.0
+    done = asyncio.Event()
+
+    def on_update():
+        nonlocal processed, last_update
+        processed += 1
+        last_update = time.perf_counter()
+        if processed >= target:
+            done.set()
+
+    async def send(n: int):
+        nonlocal target, sent
+        target = processed + n
+        done.clear()
+        for _ in range(n):
+            sender.sendto(NOTIFY_PAYLOADS[sent % 2], ("127.0.0.1", port))
+            sent += 1
+        await asyncio.wait_for(done.wait(), 5.0)
+
+    client.add_notify_callback(on_update)
+    await client.start_notification_listener()
+    try:
+        latencies = []
+        for _ in range(max(1, count // 10)):
+            started = time.perf_counter()
+            await send(1)
+            latencies.append(last_update - started)
+
+        started = time.perf_counter()
+        for offset in range(0, count, window):
+            await send(min(window, count - offset))
+        elapsed = time.perf_counter() - started
+    finally:
+        sender.close()
+        await client.close()
+
+    return _summary(count, elapsed, latencies)
+
+
+async def bench_commands(count: int, window: int) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    transport, sink = await loop.create_datagram_endpoint(_Sink, local_addr=("127.0.0.1", 0))
+    client = EmotivaClient(DeviceConfig(
+        device_id="bench", name="Bench", ip_address="127.0.0.1", model="XMC-2",
+        control_port=transport.get_extra_info("sockname")[1],
+    ))
+    await client.udp_connect()
+    try:
+        latencies = []
+        for _ in range(max(1, count // 10)):
+            sink.expect(1)
+            started = time.perf_counter()
+            await client.send_command("dim")
+            await asyncio.wait_for(sink.done.wait(), 5.0)
+            latencies.append(sink.arrivals[-1] - started)
+
+        started = time.perf_counter()
+        for offset in range(0, count, window):
+            burst = min(window, count - offset)
+            sink.expect(burst)
+            for _ in range(burst):
+                await client.send_command("dim")
+            await asyncio.wait_for(sink.done.wait(), 5.0)
+        elapsed = sink.arrivals[-1] - started
+    finally:
+        await client.close()
+        transport.close()
+
+    return _summary(count, elapsed, latencies)
+
+
+async def _bench_all(count: int, window: int) -> Dict[str, Dict[str, Any]]:
+    return {
+        "ingest": await bench_ingest(count, window),
+        "command": await bench_commands(count, window),
+    }
+
+
+def run_benchmarks(backends: List[str], count: int, window: int) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    results = {}
+    for backend in backends:
+        name, _ = runtime.loop_factory(backend)
+        if name != backend:
+            print(f"{backend}: not available, skipped")
+            continue
+        results[backend] = runtime.run(_bench_all(count, window), backend)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Emotiva client I/O per event loop backend")
+    parser.add_argument("--loops", default="asyncio,uvloop", help="comma-separated backends to compare")
+    parser.add_argument("--count", type=int, default=5000, help="datagrams per throughput run")
+    parser.add_argument("--window", type=int, default=64, help="datagrams in flight per burst")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = run_benchmarks([b.strip() for b in args.loops.split(",") if b.strip()], args.count, args.window)
+    if not results:
+        return
+
+    baseline = next(iter(results))
+    for path in ("ingest", "command"):
+        print(f"\n{path}:")
+        for backend, result in results.items():
+            stats = result[path]
+            line = (f"  {backend:<8} {stats['throughput_pps']:>9.0f} /s  "
+                    + ", ".join(f"p{p}={v:.1f}us" for p, v in stats["latency_us"].items()))
+            if backend != baseline:
+                base = results[baseline][path]
+                gain = stats["throughput_pps"] / base["throughput_pps"] - 1 if base["throughput_pps"] else 0.0
+                p50 = stats["latency_us"][50] / base["latency_us"][50] - 1 if base["latency_us"][50] else 0.0
+                line += f"  (throughput {gain:+.0%}, p50 latency {p50:+.0%} vs {baseline})"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
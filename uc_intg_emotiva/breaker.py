@@ -0,0 +1,112 @@
+"""
+Per-device circuit breaker for Emotiva processors.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+_LOG = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+
+    FAILURE_THRESHOLD = 3
+    BACKOFF_INITIAL = 2.0
+    BACKOFF_MAX = 60.0
+
+    def __init__(self, name: str, probe: Callable[[], Awaitable[bool]],
+                 on_state_change: Optional[Callable[[str], None]] = None):
+        self._name = name
+        self._probe = probe
+        self._on_state_change = on_state_change
+        self._state = CLOSED
+        self._failures = 0
+        self._backoff = self.BACKOFF_INITIAL
+        self._probe_task: Optional[asyncio.Task] = None
+        self._trips = 0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @property
+    def trips(self) -> int:
+        return self._trips
+
+    def allow_request(self) -> bool:
+        return self._state != OPEN
+
+    def record_success(self):
+        self._failures = 0
+        if self._state != CLOSED:
+            _LOG.info(f"{self._name} is responding again")
+            self._backoff = self.BACKOFF_INITIAL
+            self._set_state(CLOSED)
+
+    def record_failure(self):
+        if self._state == HALF_OPEN:
+            self._set_state(OPEN)
+        elif self._state == CLOSED:
+            self._failures += 1
+            if self._failures >= self.FAILURE_THRESHOLD:
+                self._trip()
+
+    def probe_now(self):
+        if self._state == CLOSED:
+            return
+        self._cancel_probe()
+        self._backoff = self.BACKOFF_INITIAL
+        self._probe_task = asyncio.create_task(self._probe_loop(0.0))
+
+    def close(self):
+        self._cancel_probe()
+
+    def _trip(self):
+        self._trips += 1
+        _LOG.warning(f"{self._name} is not responding, failing requests fast (retry in {self._backoff:g}s)")
+        self._set_state(OPEN)
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = asyncio.create_task(self._probe_loop(self._backoff))
+
+    def _cancel_probe(self):
+        if self._probe_task and not self._probe_task.done():
+            self._probe_task.cancel()
+        self._probe_task = None
+
+    async def _probe_loop(self, delay: float):
+        while True:
+            await asyncio.sleep(delay)
+            if self._state == CLOSED:
+                return
+
+            self._set_state(HALF_OPEN)
+            try:
+                healthy = await self._probe()
+            except Exception as e:
+                _LOG.debug(f"Probe of {self._name} failed: {e}")
+                healthy = False
+
+            if healthy or self._state == CLOSED:
+                self.record_success()
+                return
+
+            self._backoff = min(self.BACKOFF_MAX, self._backoff * 2)
+            delay = self._backoff
+            self._set_state(OPEN)
+            _LOG.debug(f"{self._name} still not responding, next probe in {delay:g}s")
+
+    def _set_state(self, state: str):
+        if state == self._state:
+            return
+        _LOG.debug(f"Circuit for {self._name}: {self._state} -> {state}")
+        self._state = state
+        if self._on_state_change:
+            self._on_state_change(state)
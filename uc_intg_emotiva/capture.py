@@ -0,0 +1,62 @@
+"""
+Capture log for Emotiva notification traffic.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import logging
+import struct
+import time
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+_LOG = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"EMCAP\x01"
+_RECORD = struct.Struct("<dI")
+
+
+class CaptureWriter:
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file: Optional[BinaryIO] = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(CAPTURE_MAGIC)
+        self._count = 0
+        _LOG.info(f"Capturing notifications to {path}")
+
+    def write(self, data: bytes, timestamp: Optional[float] = None):
+        if self._file is None:
+            return
+        self._file.write(_RECORD.pack(time.time() if timestamp is None else timestamp, len(data)))
+        self._file.write(data)
+        self._count += 1
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        _LOG.info(f"Capture closed: {self._count} datagrams written to {self._path}")
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+
+def read_capture(path: str) -> Iterator[Tuple[float, bytes]]:
+    with open(path, "rb") as file:
+        if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not a notification capture file")
+
+        while True:
+            header = file.read(_RECORD.size)
+            if len(header) < _RECORD.size:
+                return
+            timestamp, length = _RECORD.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                _LOG.warning(f"Truncated record at end of {path}")
+                return
+            yield timestamp, data
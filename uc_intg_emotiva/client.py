@@ -6,21 +6,92 @@ Emotiva Device Client Implementation
 """
 
 import asyncio
+import bisect
+import ipaddress
 import logging
+import math
+import os
 import socket
-import time
-from typing import Any, Callable, Dict, Optional, List
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, NamedTuple, Optional, List, Set, Tuple
 from lxml import etree
 
+from uc_intg_emotiva.breaker import CLOSED, CircuitBreaker
+from uc_intg_emotiva.capture import CaptureWriter
 from uc_intg_emotiva.config import DeviceConfig
+from uc_intg_emotiva import tracing
+from uc_intg_emotiva.profiling import hot_path
+from uc_intg_emotiva.profiles import ModelProfile, get_model_profile
 
 _LOG = logging.getLogger(__name__)
 
+_XML_PARSER = etree.XMLParser(ns_clean=True, recover=True)
+
+
+class StateChange(NamedTuple):
+    name: str
+    value: Any
+
+
+class _NotifyProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, client: "EmotivaClient"):
+        self._client = client
+
+    def datagram_received(self, data: bytes, addr):
+        self._client._dispatch_datagram(data, addr)
+
+
+class _PingProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self):
+        self.replies: asyncio.Queue = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr):
+        self.replies.put_nowait((data, addr[0]))
+
+    def error_received(self, exc: Exception):
+        _LOG.debug(f"Ping socket error: {exc}")
+
 
 class EmotivaClient:
     XML_HEADER = '<?xml version="1.0" encoding="utf-8"?>'.encode("utf-8")
     DISCOVER_REQ_PORT = 7000
     DISCOVER_RESP_PORT = 7001
+    PROTOCOL_VERSION = 3.0
+    PING_TIMEOUT = 1.0
+    SWEEP_CONCURRENCY = 64
+    SWEEP_RATE = 1000.0
+    SWEEP_MAX_HOSTS = 4096
+    VOLUME_CURVES = ("linear", "perceptual")
+    VOLUME_STEP = 0.5
+    VOLUME_LIMITS = (-96.0, 15.0)
+    TRIM_STEP = 0.5
+    WARMUP_TIMEOUT = 10.0
+    WARMUP_PASSTHROUGH = {"power_on", "power_off", "power", "standby"}
+    VOLUME_COMMANDS = {"set_volume", "volume"}
+    RELIABLE_ATTEMPTS = 4
+    POWER_COMMANDS = {
+        "power_on": ("power", True), "power_off": ("power", False), "standby": ("power", False),
+        "zone2_power_on": ("zone2_power", True), "zone2_power_off": ("zone2_power", False),
+    }
+    MUTE_COMMANDS = {
+        "mute_on": ("mute", True), "mute_off": ("mute", False), "mute": ("mute", None),
+        "zone2_mute_on": ("zone2_mute", True), "zone2_mute_off": ("zone2_mute", False), "zone2_mute": ("zone2_mute", None),
+    }
+    LEVEL_COMMANDS = {
+        "set_volume": ("volume", False), "volume": ("volume", True),
+        "zone2_set_volume": ("zone2_volume", False), "zone2_volume": ("zone2_volume", True),
+    }
+    RTO_INITIAL = 0.5
+    RTO_MIN = 0.1
+    RTO_MAX = 3.0
+    NOTIFY_BUFFER_SIZE = 16384
+    NOTIFY_BUFFER_MAX = 65536
+    WATCH_KEYS = {
+        "mute": "volume",
+        "zone2_mute": "zone2_volume",
+        "zone2_source": "zone2_input",
+    }
 
     def __init__(self, device_config: DeviceConfig):
         self._device_config = device_config
@@ -28,29 +99,67 @@ class EmotivaClient:
         self._control_port = device_config.control_port
         self._notify_port = device_config.notify_port
         self._protocol_version = device_config.protocol_version
+        self._packet_attrs = self._protocol_attrs(self._protocol_version)
         self._name = device_config.name
         self._model = device_config.model
         
         self._udp_stream = None
         self._notify_socket = None
         self._notify_task = None
-        self._notify_callback: Optional[Callable] = None
+        self._capture: Optional[CaptureWriter] = None
+        self._notify_callbacks: List[Callable] = []
+        self._received_waiters: Dict[str, Set[asyncio.Future]] = {}
+        self._change_waiters: Dict[str, Set[asyncio.Future]] = {}
+        self._watchers: Dict[str, Set[asyncio.Queue]] = {}
+        self._last_values: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._suppressed_updates = 0
+        self._truncated_notifications = 0
+        self._srtt: Optional[float] = None
+        self._rttvar = 0.0
+        self._rto = self.RTO_INITIAL
+        self._unsubscribe_ack: Optional[asyncio.Future] = None
+        self._ack_waiters: Dict[str, Set[asyncio.Future]] = {}
+        self._deliveries: Dict[str, asyncio.Task] = {}
+        self._delivery_targets: Dict[str, Any] = {}
+        self._retransmissions = 0
+        self._delivery_failures = 0
+        self._packets_received = 0
+        self._breaker = CircuitBreaker(self._name, self._probe, self._on_breaker_change)
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._resubscribe_task: Optional[asyncio.Task] = None
+        self._queued_commands: List[Tuple[str, str]] = []
+        self._event_consumers: Dict[str, Set[str]] = {}
+        self._subscribed_events: Set[str] = set()
+        self._idle = False
+        self._listener_active = asyncio.Event()
+        self._listener_active.set()
         self._current_state: Dict[str, Any] = {}
         self._running = False
+        self._closed = False
         
-        self._volume_max = 11
-        self._volume_min = -80
+        self._profile: ModelProfile = get_model_profile(self._model)
+        
+        self._volume_max = self._profile.volume_max
+        self._volume_min = self._profile.volume_min
         self._volume_range = self._volume_max - self._volume_min
+        self._volume_curve = device_config.volume_curve
+        if self._volume_curve not in self.VOLUME_CURVES:
+            _LOG.warning(f"Unknown volume curve '{self._volume_curve}' for {self._name}, using linear")
+            self._volume_curve = "linear"
+        self._volume_table = self._build_volume_table()
         self._muted = False
+        self._zone2_muted = False
         
-        self._modes = self._get_sound_modes_for_model(self._model)
-        self._sources = self._get_available_sources()
+        self._modes = self._profile.modes
+        self._mode_visibility: Dict[str, bool] = {}
+        self._sources = self._profile.sources
         self._detected_sources: Dict[str, str] = {}
         self._detected_modes: List[str] = []
-        self._trim_channels = self._get_trim_channels_for_model(self._model)
+        self._trim_channels = self._profile.trims
+        self._zone2_sources = self._profile.zone2_sources
         
         self._notify_events = {
-            "power", "zone2_power", "source", "mode", "volume",
+            "power", "zone2_power", "zone2_volume", "zone2_input", "source", "mode", "volume",
             "audio_input", "audio_bits", "audio_bitstream",
             "video_input", "video_format", "video_space",
             "center", "subwoofer", "surround", "back", "width", "height"
@@ -74,165 +183,191 @@ class EmotivaClient:
         for ev in self._notify_events:
             self._current_state[ev] = None
 
-    def _get_sound_modes_for_model(self, model: str) -> Dict[str, list]:
-        stripped_model = model.replace(" ", "").replace("-", "").replace("_", "").upper()[:4]
-        
-        if stripped_model == "XMC1":
-            return {
-                "Stereo": ["stereo", "mode_stereo", True],
-                "Direct": ["direct", "mode_direct", True],
-                "Dolby": ["dolby", "mode_dolby", True],
-                "DTS": ["dts", "mode_dts", True],
-                "All Stereo": ["all_stereo", "mode_all_stereo", True],
-                "Auto": ["auto", "mode_auto", True],
-                "Reference Stereo": ["reference_stereo", "mode_ref_stereo", True],
-                "Surround": ["surround_mode", "mode_surround", True],
-                "PLIIx Music": ["dolby", "mode_dolby", True],
-                "PLIIx Movie": ["dolby", "mode_dolby", True],
-                "dts Neo:6 Cinema": ["dts", "mode_dts", True],
-                "dts Neo:6 Music": ["dts", "mode_dts", True],
-            }
-        elif stripped_model == "XMC2":
-            return {
-                "Stereo": ["stereo", "mode_stereo", True],
-                "Direct": ["direct", "mode_direct", True],
-                "Dolby": ["dolby", "mode_dolby", True],
-                "DTS": ["dts", "mode_dts", True],
-                "All Stereo": ["all_stereo", "mode_all_stereo", True],
-                "Auto": ["auto", "mode_auto", True],
-                "Reference Stereo": ["reference_stereo", "mode_ref_stereo", True],
-                "Surround": ["surround_mode", "mode_surround", True],
-                "Dolby ATMOS": ["dolby", "mode_dolby", True],
-                "dts Neural:X": ["dts", "mode_dts", True],
-                "Dolby Surround": ["dolby", "mode_dolby", True],
-            }
-        elif stripped_model in ["RMC1", "RMC1L"]:
-            return {
-                "Stereo": ["stereo", "mode_stereo", True],
-                "Direct": ["direct", "mode_direct", True],
-                "Dolby": ["dolby", "mode_dolby", True],
-                "DTS": ["dts", "mode_dts", True],
-                "All Stereo": ["all_stereo", "mode_all_stereo", True],
-                "Auto": ["auto", "mode_auto", True],
-                "Reference Stereo": ["reference_stereo", "mode_ref_stereo", True],
-                "Surround": ["surround_mode", "mode_surround", True],
-                "Dolby Surround": ["dolby", "mode_dolby", True],
-                "Dolby ATMOS": ["dolby", "mode_dolby", True],
-                "dts Neural:X": ["dts", "mode_dts", True],
-            }
-        else:
-            return {
-                "Stereo": ["stereo", "mode_stereo", True],
-                "Direct": ["direct", "mode_direct", True],
-                "Dolby": ["dolby", "mode_dolby", True],
-                "DTS": ["dts", "mode_dts", True],
-                "All Stereo": ["all_stereo", "mode_all_stereo", True],
-                "Auto": ["auto", "mode_auto", True],
-                "Reference Stereo": ["reference_stereo", "mode_ref_stereo", True],
-                "Surround": ["surround_mode", "mode_surround", True],
-            }
+    def _build_volume_table(self) -> Tuple[float, ...]:
+        table = []
+        for percent in range(101):
+            fraction = percent / 100.0
+            if self._volume_curve == "perceptual":
+                db = self._volume_max + 60.0 * math.log10(fraction) if fraction > 0 else self._volume_min
+                db = max(self._volume_min, db)
+            else:
+                db = self._volume_min + fraction * self._volume_range
+            table.append(round(db / self.VOLUME_STEP) * self.VOLUME_STEP)
+        return tuple(table)
 
-    def _get_available_sources(self) -> Dict[str, str]:
-        return {
-            "source_1": "Input 1", "source_2": "Input 2", "source_3": "Input 3",
-            "source_4": "Input 4", "source_5": "Input 5", "source_6": "Input 6",
-            "source_7": "Input 7", "source_8": "Input 8",
-            "analog1": "Analog 1", "analog2": "Analog 2", "analog3": "Analog 3",
-            "analog4": "Record In", "analog5": "Analog 5", "analog71": "Analog 7.1",
-            "ARC": "HDMI ARC",
-            "coax1": "Coax 1", "coax2": "Coax 2", "coax3": "Coax 3", "coax4": "AES/EBU",
-            "hdmi1": "HDMI 1", "hdmi2": "HDMI 2", "hdmi3": "HDMI 3", "hdmi4": "HDMI 4",
-            "hdmi5": "HDMI 5", "hdmi6": "HDMI 6", "hdmi7": "HDMI 7", "hdmi8": "HDMI 8",
-            "optical1": "Optical 1", "optical2": "Optical 2", "optical3": "Optical 3", "optical4": "Optical 4",
-            "source_tuner": "Tuner", "usb_stream": "USB Stream",
-        }
+    def _set_volume_range(self, volume_min: float, volume_max: float):
+        if volume_max <= volume_min or (volume_min, volume_max) == (self._volume_min, self._volume_max):
+            return
+        
+        self._volume_min = volume_min
+        self._volume_max = volume_max
+        self._volume_range = volume_max - volume_min
+        self._volume_table = self._build_volume_table()
+        _LOG.info(f"Volume range for {self._name} calibrated to {volume_min} .. {volume_max} dB")
 
-    def _get_trim_channels_for_model(self, model: str) -> Dict[str, str]:
-        stripped_model = model.replace(" ", "").replace("-", "").replace("_", "").upper()[:4]
+    def _calibrate_volume_range(self, elem, val: str):
+        try:
+            volume_min = float(elem.get("min", self._volume_min))
+            volume_max = float(elem.get("max", self._volume_max))
+            volume = float(val.replace(" ", ""))
+        except ValueError:
+            return
         
-        if stripped_model == "XMC1":
-            return {
-                "center": "Center",
-                "subwoofer": "Subwoofer",
-                "surround": "Surround",
-                "back": "Back"
-            }
-        elif stripped_model == "XMC2":
-            return {
-                "center": "Center",
-                "subwoofer": "Subwoofer",
-                "surround": "Surround",
-                "back": "Back",
-                "width": "Width",
-                "height": "Height"
-            }
-        elif stripped_model in ["RMC1", "RMC1L"]:
-            return {
-                "center": "Center",
-                "subwoofer": "Subwoofer",
-                "surround": "Surround",
-                "back": "Back",
-                "width": "Width",
-                "height": "Height"
-            }
-        else:
-            return {
-                "center": "Center",
-                "subwoofer": "Subwoofer",
-                "surround": "Surround",
-                "back": "Back"
-            }
+        floor, ceiling = self.VOLUME_LIMITS
+        if not floor <= volume <= ceiling:
+            _LOG.debug(f"Ignoring out-of-range volume {volume} from {self._name}")
+            return
+        
+        volume_min = max(floor, volume_min)
+        volume_max = min(ceiling, volume_max)
+        self._set_volume_range(min(volume_min, volume), max(volume_max, volume))
+
+    def percent_to_volume(self, percent: float) -> float:
+        return self._volume_table[max(0, min(100, int(round(percent))))]
+
+    def volume_to_percent(self, volume: float) -> int:
+        index = bisect.bisect_left(self._volume_table, volume)
+        if index >= len(self._volume_table):
+            return 100
+        if index > 0 and volume - self._volume_table[index - 1] <= self._volume_table[index] - volume:
+            return index - 1
+        return index
 
     @classmethod
-    async def discover(cls, timeout: int = 3) -> list:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        
+    async def discover(cls, timeout: float = 3) -> list:
+        loop = asyncio.get_running_loop()
         try:
-            sock.bind(("", 0))
-        except Exception as e:
+            transport, protocol = await loop.create_datagram_endpoint(
+                _PingProtocol, local_addr=("0.0.0.0", 0), allow_broadcast=True
+            )
+        except OSError as e:
             _LOG.error(f"Cannot create discovery socket: {e}")
             return []
         
-        sock.settimeout(0.5)
-        
-        req = cls.format_request("emotivaPing", {}, {"protocol": "3.0"})
+        req = cls.format_request("emotivaPing", {}, cls._protocol_attrs(cls.PROTOCOL_VERSION))
         
         _LOG.debug("Sending discovery broadcast to port %d", cls.DISCOVER_REQ_PORT)
         
-        try:
-            sock.sendto(req, ("<broadcast>", cls.DISCOVER_REQ_PORT))
-            sock.sendto(req, ("255.255.255.255", cls.DISCOVER_REQ_PORT))
-        except Exception as e:
-            _LOG.error(f"Failed to send discovery broadcast: {e}")
-            sock.close()
+        sent = False
+        for address in ("<broadcast>", "255.255.255.255"):
+            try:
+                transport.sendto(req, (address, cls.DISCOVER_REQ_PORT))
+                sent = True
+            except (OSError, ValueError) as e:
+                _LOG.debug(f"Discovery broadcast to {address} failed: {e}")
+        if not sent:
+            _LOG.error("Failed to send discovery broadcast")
+            transport.close()
             return []
         
         devices = []
-        start_time = time.time()
+        deadline = loop.time() + timeout
         
-        while time.time() - start_time < timeout:
-            try:
-                resp_data, (ip, port) = sock.recvfrom(4096)
-                resp = cls._parse_response(resp_data)
-                _LOG.info(f"Discovery response from {ip}:{port}")
+        try:
+            while True:
+                resp_data, ip = await asyncio.wait_for(protocol.replies.get(), max(0.0, deadline - loop.time()))
+                _LOG.info(f"Discovery response from {ip}")
                 
-                device_exists = any(d[0] == ip for d in devices)
-                if not device_exists:
-                    devices.append((ip, resp))
+                if not any(d[0] == ip for d in devices):
+                    devices.append((ip, cls._parse_response(resp_data)))
                     _LOG.debug(f"Added device at {ip}")
-            except socket.timeout:
-                continue
-            except Exception as e:
-                _LOG.debug(f"Discovery receive error: {e}")
-                continue
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            transport.close()
         
-        sock.close()
         _LOG.info(f"Discovery complete: found {len(devices)} device(s)")
         
         return devices
 
+    @classmethod
+    async def sweep(cls, network: str, timeout: float = 0.5, concurrency: int = SWEEP_CONCURRENCY,
+                    rate: float = SWEEP_RATE) -> list:
+        subnet = ipaddress.ip_network(network, strict=False)
+        if subnet.num_addresses > cls.SWEEP_MAX_HOSTS:
+            raise ValueError(f"{network} has {subnet.num_addresses} addresses, sweep is limited to {cls.SWEEP_MAX_HOSTS}")
+        hosts = [str(host) for host in subnet.hosts()]
+        
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(_PingProtocol, local_addr=("0.0.0.0", 0))
+        req = cls.format_request("emotivaPing", {}, cls._protocol_attrs(cls.PROTOCOL_VERSION))
+        
+        _LOG.debug(f"Sweeping {len(hosts)} hosts in {network}")
+        try:
+            interval = concurrency / rate
+            for start in range(0, len(hosts), concurrency):
+                batch_deadline = loop.time() + interval
+                for ip in hosts[start:start + concurrency]:
+                    transport.sendto(req, (ip, cls.DISCOVER_REQ_PORT))
+                await asyncio.sleep(max(0.0, batch_deadline - loop.time()))
+            await asyncio.sleep(timeout)
+        finally:
+            transport.close()
+        
+        found: Dict[str, Any] = {}
+        while not protocol.replies.empty():
+            data, ip = protocol.replies.get_nowait()
+            if ip in found:
+                continue
+            resp = cls._parse_response(data)
+            if resp is not None and resp.tag == "emotivaTransponder":
+                _LOG.info(f"Sweep response from {ip}")
+                found[ip] = resp
+        
+        _LOG.info(f"Sweep of {network} complete: found {len(found)} device(s)")
+        return list(found.items())
+
+    @classmethod
+    async def ping(cls, ip: str, timeout: float = PING_TIMEOUT) -> Optional[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        try:
+            transport, protocol = await loop.create_datagram_endpoint(_PingProtocol, local_addr=("0.0.0.0", 0))
+        except OSError as e:
+            _LOG.debug(f"Ping to {ip} failed: {e}")
+            return None
+        
+        try:
+            req = cls.format_request("emotivaPing", {}, cls._protocol_attrs(cls.PROTOCOL_VERSION))
+            transport.sendto(req, (ip, cls.DISCOVER_REQ_PORT))
+            
+            deadline = loop.time() + timeout
+            while True:
+                data, addr = await asyncio.wait_for(protocol.replies.get(), max(0.0, deadline - loop.time()))
+                if addr == ip:
+                    return cls.parse_transponder(cls._parse_response(data))
+        except asyncio.TimeoutError:
+            _LOG.debug(f"No transponder reply from {ip} within {timeout}s")
+        finally:
+            transport.close()
+        return None
+
+    @classmethod
+    def parse_transponder(cls, resp) -> Optional[Dict[str, Any]]:
+        if resp is None or resp.tag != "emotivaTransponder":
+            return None
+        
+        try:
+            version = float(resp.findtext("control/version") or 2.0)
+            capabilities = {
+                "protocol_version": version,
+                "control_port": int(resp.findtext("control/controlPort") or 7002),
+                "notify_port": int(resp.findtext("control/notifyPort") or 7003),
+                "keepalive_interval": int(resp.findtext("control/keepAlive") or 0) / 1000.0,
+                "ack_supported": version >= 3.0,
+            }
+        except ValueError as e:
+            _LOG.warning(f"Malformed transponder reply: {e}")
+            return None
+        
+        model = (resp.findtext("model") or "").strip()
+        if model:
+            capabilities["model"] = model
+        return capabilities
+
+    @classmethod
+    def _protocol_attrs(cls, version: float) -> Dict[str, str]:
+        return {"protocol": "3.0"} if version >= cls.PROTOCOL_VERSION else {}
+
     async def detect_capabilities(self) -> Dict[str, Any]:
         _LOG.info(f"Detecting capabilities for {self._name}")
         
@@ -240,17 +375,16 @@ class EmotivaClient:
             "sources": {},
             "modes": [],
             "trims": list(self._trim_channels.keys()),
-            "has_tuner": False,
+            "has_tuner": self._profile.has_feature("tuner"),
             "max_inputs": 8,
         }
         
         try:
-            for i in range(1, 9):
-                await self.update_events([f"input_{i}"])
-            
-            await self.update_events(["mode"])
-            
-            await asyncio.sleep(2.0)
+            await self.request_update(
+                [f"input_{i}" for i in range(1, 9)] + ["mode"],
+                timeout=self._rto * 4,
+                wait_all=True
+            )
             
             for i in range(1, 9):
                 input_key = f"input_{i}"
@@ -262,11 +396,10 @@ class EmotivaClient:
                         self._detected_sources[source_cmd] = input_name
                         _LOG.debug(f"Detected source: {source_cmd} = {input_name}")
             
-            for mode_name, mode_data in self._modes.items():
-                if mode_data[2]:
-                    capabilities["modes"].append(mode_name)
-                    self._detected_modes.append(mode_name)
-                    _LOG.debug(f"Detected mode: {mode_name}")
+            for mode_name in self.available_modes:
+                capabilities["modes"].append(mode_name)
+                self._detected_modes.append(mode_name)
+                _LOG.debug(f"Detected mode: {mode_name}")
             
             _LOG.info(f"Capability detection complete: {len(capabilities['sources'])} sources, {len(capabilities['modes'])} modes, {len(capabilities['trims'])} trims")
             
@@ -279,17 +412,19 @@ class EmotivaClient:
         try:
             _LOG.info(f"Testing connection to {self._name} at {self._ip}")
             await self.udp_connect()
+            await self.start_notification_listener()
+            try:
+                reachable = await self.request_update(["power"], timeout=self.PING_TIMEOUT)
+                if not reachable:
+                    reachable = await self.ping(self._ip, self.PING_TIMEOUT) is not None
+            finally:
+                await self.stop_notification_listener()
+                await self.udp_disconnect()
             
-            msg = self.format_request(
-                "emotivaUpdate",
-                [("power", {})],
-                {"protocol": "3.0"} if self._protocol_version == 3 else {}
-            )
+            if not reachable:
+                _LOG.warning(f"Connection test failed for {self._name}: no reply from {self._ip}")
+                return False
             
-            await self._udp_send(msg)
-            await asyncio.sleep(0.5)
-            
-            await self.udp_disconnect()
             _LOG.info(f"Connection test successful for {self._name}")
             return True
         except Exception as e:
@@ -314,6 +449,10 @@ class EmotivaClient:
             
             _LOG.info(f"Notification listener bound to port {self._notify_port}")
             
+            capture_dir = os.getenv("UC_EMOTIVA_CAPTURE_DIR")
+            if capture_dir and not self._capture:
+                self.start_capture(os.path.join(capture_dir, f"{self._device_config.device_id}.emcap"))
+            
             self._running = True
             self._notify_task = asyncio.create_task(self._notification_listener_loop())
             
@@ -324,14 +463,36 @@ class EmotivaClient:
     async def _notification_listener_loop(self):
         _LOG.info(f"Notification listener started for {self._name}")
         
+        loop = asyncio.get_running_loop()
+        buffer = bytearray(self.NOTIFY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        
         while self._running:
             try:
-                loop = asyncio.get_event_loop()
-                data, addr = await loop.sock_recvfrom(self._notify_socket, 4096)
+                if not self._listener_active.is_set():
+                    _LOG.info(f"Notification listener parked for {self._name}")
+                    await self._listener_active.wait()
+                    self._drain_notify_socket()
+                    _LOG.info(f"Notification listener resumed for {self._name}")
+                    continue
                 
-                if data:
-                    _LOG.debug(f"Received notification from {addr}: {len(data)} bytes")
-                    self.handle_notification(data)
+                try:
+                    nbytes, addr = await loop.sock_recvfrom_into(self._notify_socket, buffer)
+                except NotImplementedError:
+                    _LOG.info(f"Event loop has no sock_recvfrom_into, using a datagram endpoint for {self._name}")
+                    await self._endpoint_listener()
+                    break
+                
+                if nbytes >= len(buffer):
+                    self._truncated_notifications += 1
+                    _LOG.warning(f"Dropped truncated notification from {addr} (buffer {len(buffer)} bytes)")
+                    if len(buffer) < self.NOTIFY_BUFFER_MAX:
+                        buffer = bytearray(min(len(buffer) * 2, self.NOTIFY_BUFFER_MAX))
+                        view = memoryview(buffer)
+                    continue
+                
+                if nbytes:
+                    self._dispatch_datagram(view[:nbytes], addr)
                     
             except asyncio.CancelledError:
                 _LOG.info("Notification listener task cancelled")
@@ -343,6 +504,51 @@ class EmotivaClient:
         
         _LOG.info(f"Notification listener stopped for {self._name}")
 
+    async def _endpoint_listener(self):
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: _NotifyProtocol(self), sock=self._notify_socket)
+        try:
+            await loop.create_future()
+        finally:
+            transport.close()
+
+    def _dispatch_datagram(self, data: bytes, addr):
+        if not self._listener_active.is_set():
+            return
+        _LOG.debug(f"Received notification from {addr}: {len(data)} bytes")
+        if self._capture:
+            self._capture.write(data)
+        self.handle_notification(data)
+
+    def _drain_notify_socket(self):
+        dropped = 0
+        while self._notify_socket:
+            try:
+                self._notify_socket.recv(4096)
+                dropped += 1
+            except (BlockingIOError, OSError):
+                break
+        if dropped:
+            _LOG.debug(f"Discarded {dropped} stale notification(s) for {self._name}")
+
+    async def enter_idle(self):
+        if self._idle:
+            return
+        
+        _LOG.info(f"Entering idle mode for {self._name}")
+        self._idle = True
+        self._listener_active.clear()
+        await self._sync_subscriptions()
+
+    async def exit_idle(self):
+        if not self._idle:
+            return
+        
+        _LOG.info(f"Leaving idle mode for {self._name}")
+        self._idle = False
+        self._listener_active.set()
+        self._breaker.probe_now()
+
     async def stop_notification_listener(self):
         self._running = False
         
@@ -360,6 +566,20 @@ class EmotivaClient:
             except Exception as e:
                 _LOG.debug(f"Error closing notification socket: {e}")
             self._notify_socket = None
+        
+        self.stop_capture()
+
+    def start_capture(self, path: str):
+        self.stop_capture()
+        try:
+            self._capture = CaptureWriter(path)
+        except OSError as e:
+            _LOG.error(f"Cannot start notification capture for {self._name}: {e}")
+
+    def stop_capture(self):
+        if self._capture:
+            self._capture.close()
+            self._capture = None
 
     async def udp_disconnect(self):
         try:
@@ -371,54 +591,473 @@ class EmotivaClient:
             _LOG.error(f"Cannot disconnect UDP socket: {e}")
 
     async def _udp_send(self, req):
-        try:
-            if self._udp_stream:
-                await self._udp_stream.send(req)
-        except Exception as e:
-            _LOG.error(f"Error sending UDP request: {e}")
+        if not self._breaker.allow_request():
+            _LOG.debug(f"{self._name} is unavailable, not sending request")
+            return
+        
+        with tracing.span("udp_send", bytes=len(req)):
             try:
-                _LOG.debug("Reconnecting UDP stream...")
-                await self.udp_connect()
                 if self._udp_stream:
                     await self._udp_stream.send(req)
-            except Exception as reconnect_error:
-                _LOG.error(f"Reconnection failed: {reconnect_error}")
-
-    async def subscribe_events(self):
-        _LOG.debug(f"Subscribing to events: {self._notify_events}")
-        msg = self.format_request(
-            "emotivaSubscription",
-            [(ev, None) for ev in self._notify_events],
-            {"protocol": "3.0"} if self._protocol_version == 3.0 else {}
-        )
-        await self._udp_send(msg)
+            except Exception as e:
+                _LOG.error(f"Error sending UDP request: {e}")
+                try:
+                    _LOG.debug("Reconnecting UDP stream...")
+                    await self.udp_connect()
+                    if self._udp_stream:
+                        await self._udp_stream.send(req)
+                except Exception as reconnect_error:
+                    _LOG.error(f"Reconnection failed: {reconnect_error}")
+                    self._breaker.record_failure()
+                    return
+        tracing.tracer.sent(self)
 
     async def unsubscribe_events(self):
         _LOG.debug(f"Unsubscribing from events: {self._all_events}")
         msg = self.format_request(
             "emotivaUnsubscribe",
             [(ev, None) for ev in self._all_events],
-            {"protocol": "3.0"} if self._protocol_version == 3.0 else {}
+            self._packet_attrs
         )
-        await self._udp_send(msg)
-        await asyncio.sleep(0.5)
+        loop = asyncio.get_running_loop()
+        self._unsubscribe_ack = loop.create_future()
+        sent_at = loop.time()
+        try:
+            await self._udp_send(msg)
+            self._subscribed_events = set()
+            await asyncio.wait_for(self._unsubscribe_ack, self._rto)
+            self._observe_rtt(loop.time() - sent_at)
+        except asyncio.TimeoutError:
+            _LOG.debug(f"No unsubscribe reply from {self._name} within {self._rto:.2f}s")
+        finally:
+            self._unsubscribe_ack = None
+
+    async def subscribe_consumers(self, consumers: Dict[str, Iterable[str]]):
+        for consumer_id, events in consumers.items():
+            self._event_consumers[consumer_id] = set(events) & self._notify_events
+        await self._sync_subscriptions()
+
+    async def unsubscribe_consumers(self, consumer_ids: Iterable[str]):
+        for consumer_id in consumer_ids:
+            self._event_consumers.pop(consumer_id, None)
+        await self._sync_subscriptions()
+
+    async def _sync_subscriptions(self):
+        wanted = set() if self._idle else set().union(*self._event_consumers.values())
+        to_subscribe = wanted - self._subscribed_events
+        to_unsubscribe = self._subscribed_events - wanted
+        
+        if to_subscribe:
+            _LOG.debug(f"Subscribing {self._name} to events: {sorted(to_subscribe)}")
+            msg = self.format_request(
+                "emotivaSubscription", [(ev, None) for ev in sorted(to_subscribe)], self._packet_attrs
+            )
+            await self._udp_send(msg)
+        
+        if to_unsubscribe:
+            _LOG.debug(f"Unsubscribing {self._name} from events: {sorted(to_unsubscribe)}")
+            msg = self.format_request(
+                "emotivaUnsubscribe", [(ev, None) for ev in sorted(to_unsubscribe)], self._packet_attrs
+            )
+            await self._udp_send(msg)
+        
+        self._subscribed_events = wanted
 
     async def update_events(self, events):
         msg = self.format_request(
             "emotivaUpdate",
             [(ev, {}) for ev in events],
-            {"protocol": "3.0"} if self._protocol_version == 3 else {}
+            self._packet_attrs
         )
         await self._udp_send(msg)
 
+    async def request_update(self, events, timeout: Optional[float] = None, wait_all: bool = False) -> bool:
+        if not self._breaker.allow_request():
+            return False
+        
+        loop = asyncio.get_running_loop()
+        if timeout is None:
+            timeout = self._rto
+        pending = set(events)
+        deadline = loop.time() + timeout
+        first = True
+        sent_at = None
+        
+        while pending:
+            waiter = loop.create_future()
+            self._add_waiter(self._received_waiters, pending, waiter)
+            try:
+                if first:
+                    await self.update_events(events)
+                    sent_at = loop.time()
+                    first = False
+                received = await asyncio.wait_for(waiter, max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                _LOG.debug(f"No update received from {self._name} within {timeout:.2f}s for {sorted(pending)}")
+                if sent_at is not None and timeout >= self._rto:
+                    self._backoff_rto()
+                    if not self.warming_up:
+                        self._breaker.record_failure()
+                return False
+            finally:
+                self._remove_waiter(self._received_waiters, pending, waiter)
+            
+            if sent_at is not None:
+                self._observe_rtt(loop.time() - sent_at)
+                sent_at = None
+            
+            if not wait_all:
+                return True
+            pending -= received
+        
+        return True
+
+    def _observe_rtt(self, sample: float):
+        if self._srtt is None:
+            self._srtt = sample
+            self._rttvar = sample / 2
+        else:
+            self._rttvar = 0.75 * self._rttvar + 0.25 * abs(self._srtt - sample)
+            self._srtt = 0.875 * self._srtt + 0.125 * sample
+        self._rto = min(self.RTO_MAX, max(self.RTO_MIN, self._srtt + 4 * self._rttvar))
+
+    def _backoff_rto(self):
+        self._rto = min(self.RTO_MAX, self._rto * 2)
+        _LOG.debug(f"Backing off timeout for {self._name} to {self._rto:.2f}s")
+
+    async def wait_for(self, timeout: Optional[float] = None, **conditions) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        keys = {self.WATCH_KEYS.get(name, name) for name in conditions}
+        
+        while not self.matches_state(conditions):
+            waiter = loop.create_future()
+            self._add_waiter(self._change_waiters, keys, waiter)
+            try:
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                _LOG.debug(f"Timed out waiting for {conditions} on {self._name}")
+                return False
+            finally:
+                self._remove_waiter(self._change_waiters, keys, waiter)
+        
+        return True
+
+    async def watch(self, *names: str) -> AsyncIterator[StateChange]:
+        queue: asyncio.Queue = asyncio.Queue()
+        keys: Dict[str, List[str]] = {}
+        for name in names:
+            keys.setdefault(self.WATCH_KEYS.get(name, name), []).append(name)
+        
+        last = {name: self._watch_value(name) for name in names}
+        self._add_waiter(self._watchers, keys, queue)
+        try:
+            while True:
+                changed_key = await queue.get()
+                for name in keys.get(changed_key, ()):
+                    value = self._watch_value(name)
+                    if value != last[name]:
+                        last[name] = value
+                        yield StateChange(name, value)
+        finally:
+            self._remove_waiter(self._watchers, keys, queue)
+
+    def _watch_value(self, name: str) -> Any:
+        if isinstance(getattr(type(self), name, None), property):
+            return getattr(self, name)
+        return self._current_state.get(name)
+
+    def matches_state(self, conditions: Dict[str, Any]) -> bool:
+        for name, expected in conditions.items():
+            value = self._watch_value(name)
+            if callable(expected):
+                if not expected(value):
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+    @staticmethod
+    def _add_waiter(table: Dict[str, Set], keys, waiter):
+        for key in keys:
+            table.setdefault(key, set()).add(waiter)
+
+    @staticmethod
+    def _remove_waiter(table: Dict[str, Set], keys, waiter):
+        for key in keys:
+            waiters = table.get(key)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del table[key]
+
+    def _wake_waiters(self, received: Set[str], changed: Set[str]):
+        for key in received:
+            for waiter in self._received_waiters.get(key, ()):
+                if not waiter.done():
+                    waiter.set_result(received)
+        
+        for key in changed:
+            for waiter in self._change_waiters.get(key, ()):
+                if not waiter.done():
+                    waiter.set_result(key)
+            for queue in self._watchers.get(key, ()):
+                queue.put_nowait(key)
+
     async def send_command(self, command: str, value: str = "0"):
+        if not self.available:
+            _LOG.warning(f"{self._name} is unavailable, dropping {command}")
+            return
+        
+        with tracing.span("send_command", command=command, value=str(value)):
+            if command == "power_on" and not self.power:
+                self._start_warmup()
+            elif command in ("power_off", "standby"):
+                self._cancel_warmup()
+            elif self.warming_up and command not in self.WARMUP_PASSTHROUGH and not command.startswith("zone2_"):
+                self._queue_command(command, str(value))
+                return
+            
+            await self._send_command_now(command, value)
+
+    async def _send_command_now(self, command: str, value: str = "0"):
+        slot = self._command_slot(command)
+        if slot is not None:
+            tracing.expect(self.WATCH_KEYS.get(slot, slot))
+        
+        plan = self._delivery_plan(command, str(value))
+        if plan is None:
+            await self._transmit(command, value)
+            return
+        
+        slot, target_command, target_value, conditions = plan
+        ack = self._expect_ack(command)
+        try:
+            await self._transmit(command, value, ack=ack is not None)
+        except BaseException:
+            self._release_ack(command, ack)
+            if slot not in self._deliveries:
+                self._delivery_targets.pop(slot, None)
+            raise
+        self._start_delivery(slot, command, ack, target_command, target_value, conditions)
+
+    async def _transmit(self, command: str, value: str = "0", ack: bool = False):
         msg = self.format_request(
             "emotivaControl",
-            [(command, {"value": str(value), "ack": "no"})],
-            {"protocol": "3.0"} if self._protocol_version == 3 else {}
+            [(command, {"value": str(value), "ack": "yes" if ack else "no"})],
+            self._packet_attrs
         )
         await self._udp_send(msg)
 
+    def _delivery_plan(self, command: str, value: str) -> Optional[Tuple[str, str, str, Dict[str, Any]]]:
+        if command in self.POWER_COMMANDS:
+            slot, target = self.POWER_COMMANDS[command]
+            if not self._confirmable(slot):
+                return None
+            return slot, command, value, {slot: target}
+        
+        if command in self.MUTE_COMMANDS:
+            slot, target = self.MUTE_COMMANDS[command]
+            if not self._confirmable(slot):
+                return None
+            if target is None:
+                target = not self._delivery_targets.get(slot, self._watch_value(slot))
+            self._delivery_targets[slot] = target
+            absolute = f"{slot}_on" if target else f"{slot}_off"
+            return slot, absolute, "0", {slot: target}
+        
+        if command in self.LEVEL_COMMANDS:
+            slot, relative = self.LEVEL_COMMANDS[command]
+            absolute = "zone2_set_volume" if slot == "zone2_volume" else "set_volume"
+            limits = (self._volume_min, self._volume_max)
+            step, tolerance = 1.0, self.VOLUME_STEP / 2
+        elif command in self._trim_channels or (command.startswith("set_") and command[4:] in self._trim_channels):
+            relative = command in self._trim_channels
+            slot = command if relative else command[4:]
+            absolute = f"set_{slot}"
+            limits = None
+            step, tolerance = self.TRIM_STEP, self.TRIM_STEP / 2
+        else:
+            return None
+        
+        if not self._confirmable(slot):
+            return None
+        try:
+            level = float(value)
+            if relative:
+                base = self._delivery_targets.get(slot, self._watch_value(slot))
+                if base is None:
+                    return None
+                level = float(base) + level * step
+        except ValueError:
+            return None
+        if limits:
+            level = min(limits[1], max(limits[0], level))
+        self._delivery_targets[slot] = level
+        return slot, absolute, str(level), {slot: self._near(level, tolerance)}
+
+    def _command_slot(self, command: str) -> Optional[str]:
+        for table in (self.POWER_COMMANDS, self.MUTE_COMMANDS, self.LEVEL_COMMANDS):
+            if command in table:
+                return table[command][0]
+        if command in self._trim_channels:
+            return command
+        if command.startswith("set_") and command[4:] in self._trim_channels:
+            return command[4:]
+        return None
+
+    def _confirmable(self, slot: str) -> bool:
+        return self.WATCH_KEYS.get(slot, slot) in self._subscribed_events
+
+    @staticmethod
+    def _near(level: float, tolerance: float) -> Callable[[Any], bool]:
+        def matches(current: Any) -> bool:
+            try:
+                return current is not None and abs(float(current) - level) <= tolerance
+            except ValueError:
+                return False
+        return matches
+
+    def _expect_ack(self, command: str) -> Optional[asyncio.Future]:
+        if not self.ack_supported:
+            return None
+        waiter = asyncio.get_running_loop().create_future()
+        self._add_waiter(self._ack_waiters, (command,), waiter)
+        return waiter
+
+    def _release_ack(self, command: str, ack: Optional[asyncio.Future]):
+        if ack is not None:
+            self._remove_waiter(self._ack_waiters, (command,), ack)
+
+    def _start_delivery(self, slot: str, command: str, ack: Optional[asyncio.Future],
+                        target_command: str, target_value: str, conditions: Dict[str, Any]):
+        previous = self._deliveries.get(slot)
+        if previous and not previous.done():
+            previous.cancel()
+        task = asyncio.create_task(self._deliver(slot, command, ack, target_command, target_value, conditions))
+        if ack is not None:
+            task.add_done_callback(lambda _: self._release_ack(command, ack))
+        self._deliveries[slot] = task
+
+    async def _deliver(self, slot: str, command: str, ack: Optional[asyncio.Future],
+                       target_command: str, target_value: str, conditions: Dict[str, Any]):
+        timeout = self._rto
+        received = self._packets_received
+        try:
+            for attempt in range(self.RELIABLE_ATTEMPTS):
+                if attempt:
+                    self._retransmissions += 1
+                    _LOG.info(f"Retransmitting {target_command}={target_value} to {self._name} (attempt {attempt + 1})")
+                    command = target_command
+                    ack = self._expect_ack(command)
+                    await self._transmit(command, target_value, ack=ack is not None)
+                
+                if await self._await_confirmation(ack, conditions, timeout):
+                    return
+                
+                self._release_ack(command, ack)
+                ack = None
+                timeout = min(self.RTO_MAX, timeout * 2)
+            
+            self._delivery_failures += 1
+            if self._packets_received == received:
+                self._breaker.record_failure()
+            _LOG.warning(f"{self._name} did not confirm {target_command}={target_value} after {self.RELIABLE_ATTEMPTS} attempts")
+        finally:
+            self._release_ack(command, ack)
+            if self._deliveries.get(slot) is asyncio.current_task():
+                del self._deliveries[slot]
+                self._delivery_targets.pop(slot, None)
+
+    async def _await_confirmation(self, ack: Optional[asyncio.Future], conditions: Dict[str, Any], timeout: float) -> bool:
+        if ack is None:
+            return await self.wait_for(timeout=timeout, **conditions)
+        
+        try:
+            status = await asyncio.wait_for(asyncio.shield(ack), timeout)
+        except asyncio.TimeoutError:
+            return self.matches_state(conditions)
+        
+        if status != "ack":
+            _LOG.warning(f"{self._name} rejected command ({status}), not retrying")
+        return True
+
+    async def _probe(self) -> bool:
+        return await self.request_update(["power"])
+
+    def _on_breaker_change(self, state: str):
+        if state == CLOSED:
+            self._subscribed_events = set()
+            self._resubscribe_task = asyncio.create_task(self._sync_subscriptions())
+            self._resubscribe_task.add_done_callback(self._on_resubscribed)
+        elif self._deliveries:
+            self._cancel_deliveries()
+        
+        for callback in self._notify_callbacks:
+            callback()
+
+    def _on_resubscribed(self, task: asyncio.Task):
+        if self._resubscribe_task is task:
+            self._resubscribe_task = None
+        if not task.cancelled() and task.exception():
+            _LOG.error(f"Error restoring subscriptions for {self._name}: {task.exception()}")
+
+    def _cancel_deliveries(self):
+        for task in self._deliveries.values():
+            task.cancel()
+        self._deliveries.clear()
+        self._delivery_targets.clear()
+
+    def _queue_command(self, command: str, value: str):
+        if command == "set_volume":
+            self._queued_commands = [
+                queued for queued in self._queued_commands if queued[0] not in self.VOLUME_COMMANDS
+            ]
+        self._queued_commands.append((command, value))
+        _LOG.info(f"{self._name} is warming up, queued {command}={value} ({len(self._queued_commands)} pending)")
+
+    def _start_warmup(self):
+        if self.warming_up:
+            return
+        self._warmup_task = asyncio.create_task(self._warmup())
+
+    def _cancel_warmup(self):
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        self._warmup_task = None
+        if self._queued_commands:
+            _LOG.info(f"Dropping {len(self._queued_commands)} queued command(s) for {self._name}")
+            self._queued_commands = []
+
+    async def _warmup(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.WARMUP_TIMEOUT
+        
+        if await self.wait_for(power=True, timeout=self.WARMUP_TIMEOUT):
+            while loop.time() < deadline and self._breaker.allow_request():
+                if await self.request_update(["source", "volume"], timeout=min(self._rto, deadline - loop.time())):
+                    break
+        
+        if loop.time() >= deadline:
+            _LOG.warning(f"{self._name} did not report ready within {self.WARMUP_TIMEOUT}s, flushing queued commands")
+        
+        await self._flush_queued_commands()
+
+    async def _flush_queued_commands(self):
+        while self._queued_commands:
+            command, value = self._queued_commands.pop(0)
+            await self._send_command_now(command, value)
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        if not self.warming_up:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(self._warmup_task), timeout)
+            return True
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            return False
+
     async def power_on(self):
         await self.send_command("power_on")
 
@@ -440,6 +1079,13 @@ class EmotivaClient:
     async def set_volume(self, vol: float):
         await self.send_command("set_volume", str(vol))
 
+    async def set_volume_percent(self, percent: float):
+        vol = self.percent_to_volume(percent)
+        if self.volume is not None and self.volume_to_percent(self.volume) == self.volume_to_percent(vol):
+            _LOG.debug(f"Volume already at {percent}%, not sending set_volume")
+            return
+        await self.set_volume(vol)
+
     async def mute_toggle(self):
         await self.send_command("mute")
 
@@ -472,13 +1118,14 @@ class EmotivaClient:
             _LOG.error(f"Mode '{mode}' has no command")
             return
         
+        previous_mode = self.mode
         await self.send_command(mode_cmd)
         
         if "Music" in mode or "music" in mode.lower():
-            await asyncio.sleep(0.25)
+            await self.wait_for(mode=lambda value: value != previous_mode, timeout=self._rto)
             await self.send_command("music")
         elif "Movie" in mode or "Cinema" in mode or "cinema" in mode.lower():
-            await asyncio.sleep(0.25)
+            await self.wait_for(mode=lambda value: value != previous_mode, timeout=self._rto)
             await self.send_command("movie")
 
     async def set_mode_by_command(self, mode_command: str):
@@ -499,20 +1146,96 @@ class EmotivaClient:
     async def input_previous(self):
         await self.send_command("input_down")
 
+    async def zone2_power_on(self):
+        await self.send_command("zone2_power_on")
+
+    async def zone2_power_off(self):
+        await self.send_command("zone2_power_off")
+
+    async def zone2_power_toggle(self):
+        if self.zone2_power:
+            await self.zone2_power_off()
+        else:
+            await self.zone2_power_on()
+
+    async def zone2_volume_up(self):
+        await self.send_command("zone2_volume", "1")
+
+    async def zone2_volume_down(self):
+        await self.send_command("zone2_volume", "-1")
+
+    async def zone2_set_volume(self, vol: float):
+        await self.send_command("zone2_set_volume", str(vol))
+
+    async def zone2_set_volume_percent(self, percent: float):
+        vol = self.percent_to_volume(percent)
+        if self.zone2_volume is not None and self.volume_to_percent(self.zone2_volume) == self.volume_to_percent(vol):
+            _LOG.debug(f"Zone 2 volume already at {percent}%, not sending zone2_set_volume")
+            return
+        await self.zone2_set_volume(vol)
+
+    async def zone2_mute_toggle(self):
+        await self.send_command("zone2_mute")
+
+    async def zone2_set_mute(self, enable: bool):
+        mute_cmd = "zone2_mute_on" if enable else "zone2_mute_off"
+        await self.send_command(mute_cmd)
+
+    async def zone2_set_source(self, source: str):
+        for key, value in self._zone2_sources.items():
+            if value == source:
+                await self.send_command(key)
+                return
+        _LOG.error(f"Zone 2 source '{source}' not found")
+
     def set_notify_callback(self, callback: Callable):
-        self._notify_callback = callback
+        self._notify_callbacks = [callback]
+
+    def add_notify_callback(self, callback: Callable):
+        if callback not in self._notify_callbacks:
+            self._notify_callbacks.append(callback)
 
+    def remove_notify_callback(self, callback: Callable):
+        if callback in self._notify_callbacks:
+            self._notify_callbacks.remove(callback)
+
+    @hot_path
     def handle_notification(self, data: bytes):
-        decoded_data = data.decode("utf-8")
-        if "emotivaUnsubscribe" not in decoded_data:
-            resp = self._parse_response(data)
-            self._handle_status(resp)
-            
-            if self._notify_callback:
-                self._notify_callback()
+        resp = self._parse_response(data)
+        if resp is None:
+            return
+        
+        self._packets_received += 1
+        self._breaker.record_success()
+        
+        if resp.tag == "emotivaUnsubscribe":
+            if self._unsubscribe_ack and not self._unsubscribe_ack.done():
+                self._unsubscribe_ack.set_result(None)
+            return
+        
+        if resp.tag == "emotivaAck":
+            for elem in resp:
+                for waiter in self._ack_waiters.get(elem.tag, ()):
+                    if not waiter.done():
+                        waiter.set_result(elem.get("status", "ack"))
+            return
+        
+        received, changed = self._handle_status(resp)
+        
+        if changed:
+            with tracing.tracer.confirm(self, changed):
+                for callback in self._notify_callbacks:
+                    callback()
+        else:
+            self._suppressed_updates += 1
+        
+        if self._received_waiters or self._change_waiters or self._watchers:
+            self._wake_waiters(received, changed)
 
-    def _handle_status(self, resp):
-        _LOG.debug("Handling status update")
+    @hot_path
+    def _handle_status(self, resp) -> Tuple[Set[str], Set[str]]:
+        received = set()
+        changed = set()
         for elem in resp:
             if elem.tag == "property":
                 elem.tag = elem.get("name")
@@ -520,14 +1243,20 @@ class EmotivaClient:
             if elem.tag not in self._current_state and not elem.tag.startswith("mode_"):
                 continue
             
+            received.add(elem.tag)
+            
+            raw = (elem.get("value"), elem.get("visible"))
+            if self._last_values.get(elem.tag) == raw:
+                continue
+            self._last_values[elem.tag] = raw
+            changed.add(elem.tag)
+            
             val = (elem.get("value") or "").strip()
             visible = (elem.get("visible") or "").strip()
             
             if elem.tag.startswith("mode_"):
-                for mode_name, mode_data in self._modes.items():
-                    if mode_data[1] == elem.tag:
-                        mode_data[2] = True if visible == "true" else False
-                        self._modes[mode_name] = mode_data
+                for mode_name in self._profile.mode_tags.get(elem.tag, ()):
+                    self._mode_visibility[mode_name] = visible == "true"
             
             if elem.tag.startswith("input_") and visible != "true":
                 continue
@@ -537,6 +1266,13 @@ class EmotivaClient:
                     self._muted = True
                     continue
                 self._muted = False
+                self._calibrate_volume_range(elem, val)
+            
+            if elem.tag == "zone2_volume":
+                if val == "Mute":
+                    self._zone2_muted = True
+                    continue
+                self._zone2_muted = False
             
             if val:
                 self._current_state[elem.tag] = val
@@ -545,21 +1281,25 @@ class EmotivaClient:
             if elem.tag.startswith("input_"):
                 num = elem.tag[6:]
                 source_key = f"source_{num}"
+                if self._sources is self._profile.sources:
+                    self._sources = dict(self._sources)
                 self._sources[source_key] = val
                 if val and val.strip():
                     self._detected_sources[source_key] = val
+        
+        return received, changed
 
     @classmethod
     def _parse_response(cls, data):
         try:
-            parser = etree.XMLParser(ns_clean=True, recover=True)
-            root = etree.XML(data, parser)
+            root = etree.XML(data, _XML_PARSER)
         except etree.ParseError as e:
             _LOG.error(f"XML parse error: {e}")
             return etree.Element("empty")
         return root
 
     @classmethod
+    @hot_path
     def format_request(cls, pkt_type, req, pkt_attrs=None):
         if pkt_attrs is None:
             pkt_attrs = {}
@@ -598,7 +1338,7 @@ class EmotivaClient:
     @property
     def volume_level(self):
         if self.volume is not None:
-            return (self.volume - self._volume_min) / self._volume_range
+            return self.volume_to_percent(self.volume) / 100.0
         return None
 
     @property
@@ -623,7 +1363,7 @@ class EmotivaClient:
 
     @property
     def available_modes(self):
-        return tuple(mode for mode, data in self._modes.items() if data[2])
+        return tuple(mode for mode in self._modes if self._mode_visibility.get(mode, True))
 
     @property
     def all_modes(self):
@@ -633,14 +1373,112 @@ class EmotivaClient:
     def detected_modes(self):
         return self._detected_modes
 
+    @property
+    def profile(self):
+        return self._profile
+
     @property
     def trim_channels(self):
         return self._trim_channels
 
+    @property
+    def zone2_power(self):
+        return self._current_state.get("zone2_power") == "On"
+
+    @property
+    def zone2_volume(self):
+        if self._current_state.get("zone2_volume"):
+            return float(self._current_state["zone2_volume"].replace(" ", ""))
+        return None
+
+    @property
+    def zone2_volume_level(self):
+        if self.zone2_volume is not None:
+            return self.volume_to_percent(self.zone2_volume) / 100.0
+        return None
+
+    @property
+    def zone2_mute(self):
+        return self._zone2_muted
+
+    @property
+    def zone2_source(self):
+        return self._current_state.get("zone2_input")
+
+    @property
+    def zone2_sources(self):
+        return tuple(self._zone2_sources.values())
+
+    @property
+    def warming_up(self):
+        return self._warmup_task is not None and not self._warmup_task.done()
+
+    @property
+    def idle(self):
+        return self._idle
+
+    @property
+    def consumer_ids(self):
+        return tuple(self._event_consumers.keys())
+
+    @property
+    def subscribed_events(self):
+        return frozenset(self._subscribed_events)
+
+    @property
+    def protocol_version(self):
+        return self._protocol_version
+
+    @property
+    def keepalive_interval(self):
+        return self._device_config.keepalive_interval
+
+    @property
+    def ack_supported(self):
+        return self._device_config.ack_supported
+
+    @property
+    def srtt(self):
+        return self._srtt
+
+    @property
+    def rto(self):
+        return self._rto
+
+    @property
+    def available(self):
+        return not self._closed and self._breaker.state == CLOSED
+
+    @property
+    def breaker(self):
+        return self._breaker
+
+    @property
+    def retransmissions(self):
+        return self._retransmissions
+
+    @property
+    def delivery_failures(self):
+        return self._delivery_failures
+
+    @property
+    def suppressed_updates(self):
+        return self._suppressed_updates
+
+    @property
+    def truncated_notifications(self):
+        return self._truncated_notifications
+
     @property
     def current_state(self):
         return self._current_state
 
     async def close(self):
+        self._closed = True
+        self._cancel_warmup()
+        if self._resubscribe_task:
+            self._resubscribe_task.cancel()
+        self._cancel_deliveries()
+        self._breaker.close()
         await self.stop_notification_listener()
         await self.udp_disconnect()
\ No newline at end of file
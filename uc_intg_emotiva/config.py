@@ -8,8 +8,8 @@ Configuration management for Emotiva integration.
 import json
 import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 _LOG = logging.getLogger(__name__)
 
@@ -23,7 +23,12 @@ class DeviceConfig:
     control_port: int = 7002
     notify_port: int = 7003
     protocol_version: float = 3.0
+    keepalive_interval: float = 0.0
+    ack_supported: bool = False
+    negotiated: bool = False
     enabled: bool = True
+    volume_curve: str = "linear"
+    scenes: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -34,7 +39,12 @@ class DeviceConfig:
             "control_port": self.control_port,
             "notify_port": self.notify_port,
             "protocol_version": self.protocol_version,
-            "enabled": self.enabled
+            "keepalive_interval": self.keepalive_interval,
+            "ack_supported": self.ack_supported,
+            "negotiated": self.negotiated,
+            "enabled": self.enabled,
+            "volume_curve": self.volume_curve,
+            "scenes": self.scenes
         }
     
     @classmethod
@@ -47,7 +57,12 @@ class DeviceConfig:
             control_port=data.get("control_port", 7002),
             notify_port=data.get("notify_port", 7003),
             protocol_version=data.get("protocol_version", 3.0),
-            enabled=data.get("enabled", True)
+            keepalive_interval=data.get("keepalive_interval", 0.0),
+            ack_supported=data.get("ack_supported", False),
+            negotiated=data.get("negotiated", False),
+            enabled=data.get("enabled", True),
+            volume_curve=data.get("volume_curve", "linear"),
+            scenes=data.get("scenes", {})
         )
 
 
@@ -56,6 +71,9 @@ class EmotivaConfig:
     def __init__(self, config_file_path: str = "config.json"):
         self._config_file_path = config_file_path
         self._devices: List[DeviceConfig] = []
+        self._devices_by_id: Dict[str, DeviceConfig] = {}
+        self._devices_by_ip: Dict[str, DeviceConfig] = {}
+        self._enabled_devices: Optional[Tuple[DeviceConfig, ...]] = None
         self._loaded = False
         
         config_dir = os.path.dirname(self._config_file_path)
@@ -64,6 +82,11 @@ class EmotivaConfig:
         
         self._load_config()
     
+    def _rebuild_index(self) -> None:
+        self._devices_by_id = {device.device_id: device for device in self._devices}
+        self._devices_by_ip = {device.ip_address: device for device in self._devices}
+        self._enabled_devices = None
+    
     def _load_config(self) -> None:
         try:
             if os.path.exists(self._config_file_path):
@@ -83,6 +106,8 @@ class EmotivaConfig:
             _LOG.error(f"Failed to load configuration: {e}")
             self._devices = []
             self._loaded = True
+        
+        self._rebuild_index()
     
     def _save_config(self) -> None:
         try:
@@ -107,50 +132,57 @@ class EmotivaConfig:
         return self._loaded and len(self._devices) > 0
     
     def add_device(self, device: DeviceConfig) -> None:
-        existing_ids = [d.device_id for d in self._devices]
-        if device.device_id in existing_ids:
+        if device.device_id in self._devices_by_id:
             raise ValueError(f"Device ID {device.device_id} already exists")
         
         self._devices.append(device)
+        self._devices_by_id[device.device_id] = device
+        self._devices_by_ip[device.ip_address] = device
+        self._enabled_devices = None
         self._save_config()
         _LOG.info(f"Added device: {device.name} ({device.model}) at {device.ip_address}")
     
     def remove_device(self, device_id: str) -> bool:
-        original_count = len(self._devices)
-        self._devices = [d for d in self._devices if d.device_id != device_id]
+        device = self._devices_by_id.pop(device_id, None)
+        if device is None:
+            return False
         
-        if len(self._devices) < original_count:
-            self._save_config()
-            _LOG.info(f"Removed device: {device_id}")
-            return True
-        return False
+        self._devices.remove(device)
+        self._rebuild_index()
+        self._save_config()
+        _LOG.info(f"Removed device: {device_id}")
+        return True
     
     def get_device(self, device_id: str) -> Optional[DeviceConfig]:
-        for device in self._devices:
-            if device.device_id == device_id:
-                return device
-        return None
+        return self._devices_by_id.get(device_id)
+    
+    def get_device_by_ip(self, ip_address: str) -> Optional[DeviceConfig]:
+        return self._devices_by_ip.get(ip_address)
     
     def get_all_devices(self) -> List[DeviceConfig]:
         return self._devices.copy()
     
-    def get_enabled_devices(self) -> List[DeviceConfig]:
-        return [device for device in self._devices if device.enabled]
+    def get_enabled_devices(self) -> Tuple[DeviceConfig, ...]:
+        if self._enabled_devices is None:
+            self._enabled_devices = tuple(device for device in self._devices if device.enabled)
+        return self._enabled_devices
     
     def update_device(self, device_id: str, **kwargs) -> bool:
         device = self.get_device(device_id)
         if not device:
             return False
         
-        allowed_fields = ['name', 'ip_address', 'model', 'control_port', 'notify_port', 'protocol_version', 'enabled']
+        allowed_fields = ['name', 'ip_address', 'model', 'control_port', 'notify_port', 'protocol_version',
+                          'keepalive_interval', 'ack_supported', 'negotiated', 'enabled', 'volume_curve', 'scenes']
         updated = False
         
-        for field, value in kwargs.items():
-            if field in allowed_fields and hasattr(device, field):
-                setattr(device, field, value)
+        for name, value in kwargs.items():
+            if name in allowed_fields and hasattr(device, name):
+                setattr(device, name, value)
                 updated = True
         
         if updated:
+            self._rebuild_index()
             self._save_config()
             _LOG.info(f"Updated device: {device_id}")
         
@@ -158,6 +190,7 @@ class EmotivaConfig:
     
     def clear_all_devices(self) -> None:
         self._devices = []
+        self._rebuild_index()
         self._save_config()
         _LOG.info("Cleared all device configurations")
     
@@ -5,33 +5,69 @@ Emotiva integration driver for Unfolded Circle Remote.
 :license: MPL-2.0, see LICENSE for more details.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
 import os
-from typing import Dict, List, Any
+import signal
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union
+
+# Imported first so the timeline origin covers the rest of the import phase.
+from uc_intg_emotiva.startup import timeline
 
 import ucapi
 from ucapi import DeviceStates, Events, StatusCodes, IntegrationSetupError, SetupComplete, SetupError, RequestUserInput, UserDataResponse
 
-from uc_intg_emotiva.client import EmotivaClient
+from uc_intg_emotiva import runtime
 from uc_intg_emotiva.config import EmotivaConfig, DeviceConfig
-from uc_intg_emotiva.media_player import EmotivaMediaPlayer
-from uc_intg_emotiva.remote import EmotivaRemote
+from uc_intg_emotiva.profiles import load_profile_overrides
+from uc_intg_emotiva.profiling import Profiler
+from uc_intg_emotiva.tracing import tracer
+
+# The client (lxml) and entity modules are imported when the first device is
+# set up, so an unconfigured driver reaches the Remote without loading them.
+if TYPE_CHECKING:
+    from uc_intg_emotiva.client import EmotivaClient
+    from uc_intg_emotiva.media_player import EmotivaMediaPlayer
+    from uc_intg_emotiva.remote import EmotivaRemote
+    from uc_intg_emotiva.sensor import EmotivaSignalSensor
+    from uc_intg_emotiva.zone2 import EmotivaZone2MediaPlayer
+
+    EmotivaEntity = Union[EmotivaMediaPlayer, EmotivaRemote, EmotivaZone2MediaPlayer, EmotivaSignalSensor]
+
+timeline.record("imports", timeline.origin)
 
 api: ucapi.IntegrationAPI | None = None
 config: EmotivaConfig | None = None
 clients: Dict[str, EmotivaClient] = {}
 media_players: Dict[str, EmotivaMediaPlayer] = {}
 remotes: Dict[str, EmotivaRemote] = {}
+zone2_players: Dict[str, EmotivaZone2MediaPlayer] = {}
+sensors: Dict[str, List[EmotivaSignalSensor]] = {}
+entities_by_id: Dict[str, EmotivaEntity] = {}
+running_configs: Dict[str, Dict[str, Any]] = {}
 entities_ready: bool = False
+idle_task: asyncio.Task | None = None
+retry_task: asyncio.Task | None = None
+profiler: Profiler | None = None
 initialization_lock: asyncio.Lock = asyncio.Lock()
 setup_state = {"step": "initial", "device_count": 1, "devices_data": []}
 
 _LOG = logging.getLogger(__name__)
 
+IDLE_TIMEOUT = float(os.getenv("UC_EMOTIVA_IDLE_TIMEOUT", "300"))
+SHUTDOWN_TIMEOUT = float(os.getenv("UC_EMOTIVA_SHUTDOWN_TIMEOUT", "3"))
+SETUP_RETRY_INITIAL = 5.0
+SETUP_RETRY_MAX = 300.0
+PROFILE_SECONDS = float(os.getenv("UC_EMOTIVA_PROFILE_SECONDS", "30"))
+PROFILE_MODE = os.getenv("UC_EMOTIVA_PROFILE_MODE", "sampling")
+PROFILE_SOCKET = os.getenv("UC_EMOTIVA_PROFILE_SOCKET", "")
+TRACE_BUFFER = int(os.getenv("UC_EMOTIVA_TRACE_BUFFER", "256"))
+
 
 async def _initialize_integration():
-    global clients, api, config, media_players, remotes, entities_ready
+    global clients, api, config, media_players, remotes, zone2_players, sensors, entities_by_id, entities_ready
     
     async with initialization_lock:
         if entities_ready:
@@ -48,64 +84,25 @@ async def _initialize_integration():
         if api:
             await api.set_device_state(DeviceStates.CONNECTING)
 
-        connected_devices = 0
-
         api.available_entities.clear()
         clients.clear()
+        running_configs.clear()
         media_players.clear()
         remotes.clear()
+        zone2_players.clear()
+        sensors.clear()
+        entities_by_id.clear()
 
-        for device_config in config.get_enabled_devices():
-            try:
-                _LOG.info("Connecting to Emotiva device: %s at %s", device_config.name, device_config.ip_address)
-                
-                client = EmotivaClient(device_config)
-                
-                connection_success = await client.test_connection()
-                if not connection_success:
-                    _LOG.warning("Failed to connect to device: %s", device_config.name)
-                    await client.close()
-                    continue
-
-                await client.udp_connect()
-                
-                await client.start_notification_listener()
-                
-                await client.subscribe_events()
-                
-                _LOG.info("Detecting capabilities for %s...", device_config.name)
-                capabilities = await client.detect_capabilities()
-                _LOG.info("Detected %d sources and %d modes for %s", 
-                         len(capabilities.get('sources', {})), 
-                         len(capabilities.get('modes', [])),
-                         device_config.name)
-
-                device_name = device_config.name
-                device_entity_id = device_config.device_id
-
-                _LOG.info("Connected to Emotiva device: %s (ID: %s, Model: %s)", 
-                         device_name, device_entity_id, device_config.model)
-
-                media_player_entity = EmotivaMediaPlayer(client, device_config, api)
-                remote_entity = EmotivaRemote(client, device_config, api)
-
-                api.available_entities.add(media_player_entity)
-                api.available_entities.add(remote_entity)
-
-                clients[device_config.device_id] = client
-                media_players[device_config.device_id] = media_player_entity
-                remotes[device_config.device_id] = remote_entity
-
-                connected_devices += 1
-                _LOG.info("Successfully setup device: %s with notification listener active", device_config.name)
+        results = await asyncio.gather(*(_setup_device(device) for device in config.get_enabled_devices()))
+        connected_devices = sum(results)
 
-            except Exception as e:
-                _LOG.error("Failed to setup device %s: %s", device_config.name, e, exc_info=True)
-                continue
+        if connected_devices < len(config.get_enabled_devices()):
+            _schedule_setup_retry()
 
         if connected_devices > 0:
             entities_ready = True
             await api.set_device_state(DeviceStates.CONNECTED)
+            timeline.milestone("connected")
             _LOG.info("Emotiva integration initialization completed successfully - %d/%d devices connected.", 
                      connected_devices, len(config.get_all_devices()))
             return True
@@ -117,26 +114,341 @@ async def _initialize_integration():
             return False
 
 
+async def _negotiate_device(device_config: DeviceConfig) -> bool:
+    from uc_intg_emotiva.client import EmotivaClient
+
+    capabilities = await EmotivaClient.ping(device_config.ip_address)
+    if capabilities is None:
+        _LOG.info("No transponder reply from %s, using configured protocol settings", device_config.ip_address)
+        return False
+
+    _LOG.info("Negotiated with %s: %s", device_config.ip_address, capabilities)
+    _apply_capabilities(device_config, capabilities)
+    return True
+
+
+def _apply_capabilities(device_config: DeviceConfig, capabilities: Dict[str, Any]):
+    capabilities = dict(capabilities, negotiated=True)
+    if config and config.get_device(device_config.device_id) is device_config:
+        config.update_device(device_config.device_id, **capabilities)
+    else:
+        for field, value in capabilities.items():
+            setattr(device_config, field, value)
+
+
+async def _setup_device(device_config: DeviceConfig) -> bool:
+    stage = device_config.device_id
+    with timeline.phase(f"{stage}: imports"):
+        from uc_intg_emotiva.client import EmotivaClient
+        from uc_intg_emotiva.media_player import EmotivaMediaPlayer
+        from uc_intg_emotiva.remote import EmotivaRemote
+        from uc_intg_emotiva.sensor import EmotivaSignalSensor, SIGNAL_SENSORS
+        from uc_intg_emotiva.zone2 import EmotivaZone2MediaPlayer
+
+    client = None
+    try:
+        _LOG.info("Connecting to Emotiva device: %s at %s", device_config.name, device_config.ip_address)
+        
+        if not device_config.negotiated:
+            with timeline.phase(f"{stage}: negotiate"):
+                await _negotiate_device(device_config)
+        
+        client = EmotivaClient(device_config)
+        
+        with timeline.phase(f"{stage}: connect"):
+            connection_success = await client.test_connection()
+            if not connection_success:
+                _LOG.warning("Failed to connect to device: %s", device_config.name)
+                await client.close()
+                return False
+
+            await client.udp_connect()
+            
+            await client.start_notification_listener()
+        
+        _LOG.info("Detecting capabilities for %s...", device_config.name)
+        with timeline.phase(f"{stage}: capabilities"):
+            capabilities = await client.detect_capabilities()
+        _LOG.info("Detected %d sources and %d modes for %s", 
+                 len(capabilities.get('sources', {})), 
+                 len(capabilities.get('modes', [])),
+                 device_config.name)
+
+        device_name = device_config.name
+        device_entity_id = device_config.device_id
+
+        _LOG.info("Connected to Emotiva device: %s (ID: %s, Model: %s)", 
+                 device_name, device_entity_id, device_config.model)
+
+        with timeline.phase(f"{stage}: entities"):
+            media_player_entity = EmotivaMediaPlayer(client, device_config, api)
+            remote_entity = EmotivaRemote(client, device_config, api)
+            zone2_entity = None
+            if client.profile.has_feature("zone2"):
+                zone2_entity = EmotivaZone2MediaPlayer(client, device_config, api)
+            sensor_entities = [
+                EmotivaSignalSensor(client, device_config, api, prop) for prop in SIGNAL_SENSORS
+            ]
+
+            device_entities = [media_player_entity, remote_entity, zone2_entity] + sensor_entities
+            for entity in (entity for entity in device_entities if entity is not None):
+                api.available_entities.add(entity)
+                if api.configured_entities.contains(entity.id):
+                    api.configured_entities.remove(entity.id)
+                    api.configured_entities.add(entity)
+                entities_by_id[entity.id] = entity
+
+        clients[device_config.device_id] = client
+        running_configs[device_config.device_id] = device_config.to_dict()
+        media_players[device_config.device_id] = media_player_entity
+        remotes[device_config.device_id] = remote_entity
+        if zone2_entity:
+            zone2_players[device_config.device_id] = zone2_entity
+        sensors[device_config.device_id] = sensor_entities
+
+        _LOG.info("Successfully setup device: %s with notification listener active", device_config.name)
+        return True
+
+    except Exception as e:
+        _LOG.error("Failed to setup device %s: %s", device_config.name, e, exc_info=True)
+        if client:
+            await client.close()
+        return False
+
+
+def _device_entities(device_id: str) -> List[EmotivaEntity]:
+    device_entities = [
+        media_players.get(device_id), remotes.get(device_id), zone2_players.get(device_id)
+    ] + sensors.get(device_id, [])
+    return [entity for entity in device_entities if entity is not None]
+
+
+async def _teardown_device(device_id: str, keep_configured: bool = False):
+    client = clients.pop(device_id, None)
+    running_configs.pop(device_id, None)
+    device_entities = [
+        media_players.pop(device_id, None),
+        remotes.pop(device_id, None),
+        zone2_players.pop(device_id, None),
+    ] + sensors.pop(device_id, [])
+
+    for entity in device_entities:
+        if entity is None:
+            continue
+        entities_by_id.pop(entity.id, None)
+        if api:
+            api.available_entities.remove(entity.id)
+            if not keep_configured:
+                api.configured_entities.remove(entity.id)
+
+    if client:
+        try:
+            await client.unsubscribe_events()
+            await client.close()
+        except Exception as e:
+            _LOG.error(f"Error closing client {device_id}: {e}")
+
+
+async def _apply_config_changes():
+    async with initialization_lock:
+        if not config:
+            return
+
+        wanted = {device.device_id: device for device in config.get_enabled_devices()}
+        removed = [device_id for device_id in clients if device_id not in wanted]
+        changed = [
+            device_id for device_id, device in wanted.items()
+            if device_id in clients and running_configs.get(device_id) != device.to_dict()
+        ]
+        added = [device_id for device_id in wanted if device_id not in clients]
+
+        if not (removed or changed or added):
+            _LOG.debug("Configuration unchanged, nothing to reload")
+            return
+
+        _LOG.info("Reloading configuration: %d added, %d changed, %d removed", len(added), len(changed), len(removed))
+
+        stale = {device_id: _device_entities(device_id) for device_id in changed}
+        await asyncio.gather(
+            *(_teardown_device(device_id) for device_id in removed),
+            *(_teardown_device(device_id, keep_configured=True) for device_id in changed),
+        )
+        await asyncio.gather(*(_setup_device(wanted[device_id]) for device_id in changed + added))
+        await _resync_devices(changed + added)
+        for device_id in changed:
+            if device_id not in clients:
+                for entity in stale[device_id]:
+                    entity._on_device_update()
+        if len(clients) < len(wanted):
+            _schedule_setup_retry()
+
+        if api:
+            await api.set_device_state(DeviceStates.CONNECTED if clients else DeviceStates.ERROR)
+
+
+def _schedule_setup_retry():
+    global retry_task
+
+    if retry_task is None or retry_task.done():
+        retry_task = asyncio.create_task(_retry_failed_devices())
+
+
+async def _retry_failed_devices():
+    global entities_ready
+
+    delay = SETUP_RETRY_INITIAL
+    while True:
+        await asyncio.sleep(delay)
+
+        async with initialization_lock:
+            pending = [device for device in config.get_enabled_devices() if device.device_id not in clients]
+            if not pending:
+                return
+
+            _LOG.info("Retrying setup of %d device(s)", len(pending))
+            results = await asyncio.gather(*(_setup_device(device) for device in pending))
+
+            if any(results):
+                entities_ready = True
+                if api:
+                    await api.set_device_state(DeviceStates.CONNECTED)
+                await _resync_devices([device.device_id for device, ok in zip(pending, results) if ok])
+            if all(results):
+                return
+
+        delay = min(SETUP_RETRY_MAX, delay * 2)
+        _LOG.info("Next setup retry in %.0fs", delay)
+
+
+async def _shutdown_clients(timeout: float):
+    async def close_client(client: EmotivaClient):
+        try:
+            await client.unsubscribe_events()
+            await client.close()
+        except Exception as e:
+            _LOG.error(f"Error closing client: {e}")
+
+    try:
+        await asyncio.wait_for(asyncio.gather(*(close_client(client) for client in clients.values())), timeout)
+    except asyncio.TimeoutError:
+        _LOG.warning("Shutdown did not complete within %.1fs, abandoning remaining clients", timeout)
+
+
 async def setup_handler(msg: ucapi.SetupDriver) -> ucapi.SetupAction:
-    global config, entities_ready, setup_state
+    global config, entities_ready
 
     if isinstance(msg, ucapi.DriverSetupRequest):
-        device_count = int(msg.setup_data.get("device_count", 1))
-        
-        if device_count == 1:
-            return await _handle_single_device_setup(msg.setup_data)
-        else:
-            setup_state = {"step": "collect_ips", "device_count": device_count, "devices_data": []}
-            return await _request_device_ips(device_count)
+        if msg.setup_data.get("setup_mode") == "discover":
+            return await _handle_discovery_setup(msg.setup_data)
+        return await _handle_manual_setup(msg.setup_data)
     
     elif isinstance(msg, UserDataResponse):
         if setup_state["step"] == "collect_ips":
             return await _handle_device_ips_collection(msg.input_values)
+        if setup_state["step"] == "select_devices":
+            return await _handle_device_selection(msg.input_values)
 
     return SetupError(IntegrationSetupError.OTHER)
 
 
+async def _handle_manual_setup(setup_data: Dict[str, Any]) -> ucapi.SetupAction:
+    global setup_state
+    
+    device_count = int(setup_data.get("device_count", 1))
+    
+    if device_count == 1:
+        return await _handle_single_device_setup(setup_data)
+    else:
+        setup_state = {"step": "collect_ips", "device_count": device_count, "devices_data": []}
+        return await _request_device_ips(device_count)
+
+
+async def _handle_discovery_setup(setup_data: Dict[str, Any]) -> ucapi.SetupAction:
+    global setup_state
+    from uc_intg_emotiva.client import EmotivaClient
+    
+    subnet = setup_data.get("discovery_subnet", "").strip()
+    try:
+        if subnet:
+            _LOG.info(f"Sweeping {subnet} for Emotiva processors")
+            found = await EmotivaClient.sweep(subnet)
+        else:
+            found = await EmotivaClient.discover(timeout=2)
+    except ValueError as e:
+        _LOG.error(f"Invalid discovery subnet '{subnet}': {e}")
+        return SetupError(IntegrationSetupError.OTHER)
+    
+    discovered = []
+    for ip, resp in found:
+        capabilities = EmotivaClient.parse_transponder(resp)
+        if capabilities is None:
+            continue
+        if config.get_device_by_ip(ip):
+            _LOG.info(f"Skipping already configured processor at {ip}")
+            continue
+        discovered.append({
+            "ip": ip,
+            "name": (resp.findtext("name") or "").strip() or f"Emotiva Processor ({ip})",
+            "capabilities": capabilities,
+        })
+    
+    if not discovered:
+        if setup_data.get("host", "").strip() or int(setup_data.get("device_count", 1)) > 1:
+            _LOG.info("No new processors discovered, falling back to manual setup")
+            return await _handle_manual_setup(setup_data)
+        return SetupError(IntegrationSetupError.NOT_FOUND)
+    
+    setup_state = {"step": "select_devices", "discovered": discovered}
+    return await _request_device_selection(discovered)
+
+
+async def _request_device_selection(discovered: List[Dict[str, Any]]) -> RequestUserInput:
+    settings = [
+        {
+            "id": f"device_{i}",
+            "label": {"en": f"{device['name']} ({device['capabilities'].get('model', 'Unknown')}) - {device['ip']}"},
+            "field": {"checkbox": {"value": True}}
+        }
+        for i, device in enumerate(discovered)
+    ]
+    
+    return RequestUserInput(
+        title={"en": f"Select Emotiva Processors ({len(discovered)} found)"},
+        settings=settings
+    )
+
+
+async def _handle_device_selection(input_values: Dict[str, Any]) -> ucapi.SetupAction:
+    selected = [
+        device for i, device in enumerate(setup_state["discovered"])
+        if str(input_values.get(f"device_{i}", "false")).lower() == "true"
+    ]
+    
+    if not selected:
+        _LOG.error("No processors selected")
+        return SetupError(IntegrationSetupError.OTHER)
+    
+    for device in selected:
+        device_config = DeviceConfig(
+            device_id=f"emotiva_{device['ip'].replace('.', '_')}",
+            name=device["name"],
+            ip_address=device["ip"],
+            model="Unknown"
+        )
+        _apply_capabilities(device_config, device["capabilities"])
+        config.add_device(device_config)
+    
+    if entities_ready:
+        await _apply_config_changes()
+    else:
+        await _initialize_integration()
+    _LOG.info(f"Discovery setup completed: {len(selected)} device(s) configured")
+    return SetupComplete()
+
+
 async def _handle_single_device_setup(setup_data: Dict[str, Any]) -> ucapi.SetupAction:
+    from uc_intg_emotiva.client import EmotivaClient
+
     host = setup_data.get("host", "").strip()
     control_port = int(setup_data.get("control_port", 7002))
     notify_port = int(setup_data.get("notify_port", 7003))
@@ -153,10 +465,11 @@ async def _handle_single_device_setup(setup_data: Dict[str, Any]) -> ucapi.Setup
         ip_address=host,
         model="Unknown",
         control_port=control_port,
-        notify_port=notify_port,
-        protocol_version=3.0
+        notify_port=notify_port
     )
     
+    await _negotiate_device(device_config)
+    
     test_client = EmotivaClient(device_config)
     try:
         connection_success = await test_client.test_connection()
@@ -168,7 +481,10 @@ async def _handle_single_device_setup(setup_data: Dict[str, Any]) -> ucapi.Setup
         return SetupError(IntegrationSetupError.CONNECTION_REFUSED)
     
     config.add_device(device_config)
-    await _initialize_integration()
+    if entities_ready:
+        await _apply_config_changes()
+    else:
+        await _initialize_integration()
     return SetupComplete()
 
 
@@ -216,18 +532,8 @@ async def _handle_device_ips_collection(input_values: Dict[str, Any]) -> ucapi.S
     test_results = await _test_multiple_devices(devices_to_test)
     
     successful_devices = 0
-    for device_data, success in zip(devices_to_test, test_results):
-        if success:
-            device_id = f"emotiva_{device_data['host'].replace('.', '_')}"
-            device_config = DeviceConfig(
-                device_id=device_id,
-                name=device_data['name'],
-                ip_address=device_data['host'],
-                model="Unknown",
-                control_port=7002,
-                notify_port=7003,
-                protocol_version=3.0
-            )
+    for device_data, device_config in zip(devices_to_test, test_results):
+        if device_config:
             config.add_device(device_config)
             successful_devices += 1
             _LOG.info(f"✅ Device {device_data['index'] + 1} ({device_data['name']}) connection successful")
@@ -238,38 +544,44 @@ async def _handle_device_ips_collection(input_values: Dict[str, Any]) -> ucapi.S
         _LOG.error("No devices could be connected")
         return SetupError(IntegrationSetupError.CONNECTION_REFUSED)
     
-    await _initialize_integration()
+    if entities_ready:
+        await _apply_config_changes()
+    else:
+        await _initialize_integration()
     _LOG.info(f"Multi-device setup completed: {successful_devices}/{len(devices_to_test)} devices configured")
     return SetupComplete()
 
 
-async def _test_multiple_devices(devices: List[Dict]) -> List[bool]:
+async def _test_multiple_devices(devices: List[Dict]) -> List[Optional[DeviceConfig]]:
+    from uc_intg_emotiva.client import EmotivaClient
+
     async def test_device(device_data):
         try:
             device_config = DeviceConfig(
-                device_id=f"temp_{device_data['index']}",
+                device_id=f"emotiva_{device_data['host'].replace('.', '_')}",
                 name=device_data['name'],
                 ip_address=device_data['host'],
-                model="Unknown",
-                control_port=7002,
-                notify_port=7003
+                model="Unknown"
             )
             
+            await _negotiate_device(device_config)
+            
             client = EmotivaClient(device_config)
             success = await client.test_connection()
             await client.close()
             
             if success:
                 _LOG.info(f"Device {device_data['index'] + 1}: Connection successful")
-            return success
+                return device_config
+            return None
         except Exception as e:
             _LOG.error(f"Device {device_data['index'] + 1} test error: {e}")
-            return False
+            return None
     
     tasks = [test_device(device) for device in devices]
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
-    return [result if isinstance(result, bool) else False for result in results]
+    return [result if isinstance(result, DeviceConfig) else None for result in results]
 
 
 async def on_subscribe_entities(entity_ids: List[str]):
@@ -282,32 +594,61 @@ async def on_subscribe_entities(entity_ids: List[str]):
             _LOG.error("Failed to initialize during subscription attempt")
             return
     
+    device_entities: Dict[str, List[EmotivaEntity]] = {}
     for entity_id in entity_ids:
-        for media_player in media_players.values():
-            if media_player.id == entity_id:
-                _LOG.info(f"Requesting initial state for media player: {entity_id}")
-                await media_player._client.update_events([
-                    "power", "volume", "source", "mode",
-                    "audio_input", "video_input"
-                ])
-                await asyncio.sleep(0.5)
-                await media_player.push_update()
-                break
-        
-        for remote in remotes.values():
-            if remote.id == entity_id:
-                _LOG.info(f"Requesting initial state for remote: {entity_id}")
-                await remote._client.update_events(["power"])
-                await asyncio.sleep(0.3)
-                await remote.push_update()
-                break
+        entity = entities_by_id.get(entity_id)
+        if entity is None:
+            _LOG.warning(f"Subscribed to unknown entity: {entity_id}")
+            continue
+        device_entities.setdefault(entity._device_config.device_id, []).append(entity)
+    
+    tasks = [_sync_device_entities(entities) for entities in device_entities.values()]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            _LOG.error(f"Error requesting initial state: {result}")
+
+
+async def _resync_devices(device_ids: List[str]):
+    groups = []
+    for device_id in device_ids:
+        if device_id not in clients or not api:
+            continue
+        configured = [
+            entity for entity in _device_entities(device_id)
+            if api.configured_entities.contains(entity.id)
+        ]
+        if configured:
+            groups.append(configured)
+    
+    results = await asyncio.gather(*(_sync_device_entities(entities) for entities in groups), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            _LOG.error(f"Error restoring subscriptions: {result}")
+
+
+async def _sync_device_entities(entities: List[EmotivaEntity]):
+    client = entities[0]._client
+    events = list(dict.fromkeys(ev for entity in entities for ev in entity.SYNC_EVENTS))
+    
+    await client.subscribe_consumers({entity.id: entity.NOTIFY_EVENTS for entity in entities})
+    
+    _LOG.info(f"Requesting initial state for {[entity.id for entity in entities]}: {events}")
+    await client.request_update(events)
+    
+    for entity in entities:
+        entity._on_device_update()
 
 
 async def on_connect():
-    global entities_ready
+    global entities_ready, idle_task
     
     _LOG.info("Remote Two connected")
     
+    if idle_task:
+        idle_task.cancel()
+        idle_task = None
+    
     if config:
         config.reload_from_disk()
     
@@ -317,8 +658,10 @@ async def on_connect():
             await _initialize_integration()
         else:
             _LOG.info("Entities already ready, confirming connection")
+            await _apply_config_changes()
             if api:
                 await api.set_device_state(DeviceStates.CONNECTED)
+            await _resume_from_idle()
     else:
         _LOG.info("Not configured, waiting for setup")
         if api:
@@ -326,15 +669,80 @@ async def on_connect():
 
 
 async def on_disconnect():
+    global idle_task
+    
     _LOG.info("Remote Two disconnected")
+    
+    if IDLE_TIMEOUT > 0 and clients and not idle_task:
+        idle_task = asyncio.create_task(_enter_idle_after(IDLE_TIMEOUT))
+
+
+async def _enter_idle_after(delay: float):
+    global idle_task
+    
+    try:
+        await asyncio.sleep(delay)
+        _LOG.info("Remote disconnected for %.0fs, entering idle mode", delay)
+        await asyncio.gather(*(client.enter_idle() for client in clients.values()), return_exceptions=True)
+    except asyncio.CancelledError:
+        pass
+    finally:
+        idle_task = None
+
+
+async def _resume_from_idle():
+    idle_clients = [client for client in clients.values() if client.idle]
+    if not idle_clients:
+        return
+    
+    _LOG.info("Resuming %d device(s) from idle mode", len(idle_clients))
+    tasks = []
+    for client in idle_clients:
+        await client.exit_idle()
+        entities = [entities_by_id[entity_id] for entity_id in client.consumer_ids if entity_id in entities_by_id]
+        if entities:
+            tasks.append(_sync_device_entities(entities))
+    
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            _LOG.error(f"Error resyncing after idle: {result}")
 
 
 async def on_unsubscribe_entities(entity_ids: List[str]):
     _LOG.info("Entities unsubscribed: %s", entity_ids)
+    
+    device_entity_ids: Dict[str, List[str]] = {}
+    for entity_id in entity_ids:
+        entity = entities_by_id.get(entity_id)
+        if entity is not None:
+            device_entity_ids.setdefault(entity._device_config.device_id, []).append(entity_id)
+    
+    for device_id, ids in device_entity_ids.items():
+        client = clients.get(device_id)
+        if client:
+            try:
+                await client.unsubscribe_consumers(ids)
+            except Exception as e:
+                _LOG.error(f"Error updating subscriptions for {device_id}: {e}")
+
+
+def _on_reload_signal():
+    _LOG.info("Reload requested, re-reading configuration")
+    if config:
+        config.reload_from_disk()
+    asyncio.create_task(_apply_config_changes())
+
+
+def _on_trace_signal(output_dir: str):
+    try:
+        tracer.dump(output_dir)
+    except OSError as e:
+        _LOG.error("Cannot export command traces: %s", e)
 
 
 async def main():
-    global api, config
+    global api, config, profiler
     
     logging.basicConfig(
         level=logging.INFO,
@@ -344,49 +752,76 @@ async def main():
     
     try:
         loop = asyncio.get_running_loop()
+        _LOG.info("Event loop: %s.%s", type(loop).__module__, type(loop).__name__)
         
         config_dir = os.getenv("UC_CONFIG_HOME", "./")
         config_file_path = os.path.join(config_dir, "config.json")
-        config = EmotivaConfig(config_file_path)
+        with timeline.phase("config load"):
+            config = EmotivaConfig(config_file_path)
+            load_profile_overrides(os.path.join(config_dir, "model_profiles.json"))
 
         driver_path = os.path.join(os.path.dirname(__file__), "..", "driver.json")
-        api = ucapi.IntegrationAPI(loop)
+        with timeline.phase("api create"):
+            api = ucapi.IntegrationAPI(loop)
 
         if config.is_configured():
             _LOG.info("Pre-configuring entities before UC Remote connection")
             _LOG.info(f"Configuration summary: {config.get_summary()}")
-            await _initialize_integration()
+            with timeline.phase("device bring-up"):
+                await _initialize_integration()
 
-        await api.init(os.path.abspath(driver_path), setup_handler)
+        with timeline.phase("api init"):
+            await api.init(os.path.abspath(driver_path), setup_handler)
 
         api.add_listener(Events.SUBSCRIBE_ENTITIES, on_subscribe_entities)
         api.add_listener(Events.UNSUBSCRIBE_ENTITIES, on_unsubscribe_entities)
         api.add_listener(Events.CONNECT, on_connect)
         api.add_listener(Events.DISCONNECT, on_disconnect)
 
+        try:
+            loop.add_signal_handler(signal.SIGHUP, _on_reload_signal)
+        except (NotImplementedError, AttributeError):
+            _LOG.debug("SIGHUP reload not supported on this platform")
+
+        tracer.configure(TRACE_BUFFER)
+        try:
+            loop.add_signal_handler(signal.SIGUSR2, _on_trace_signal, os.path.join(config_dir, "traces"))
+        except (NotImplementedError, AttributeError):
+            _LOG.debug("SIGUSR2 trace export not supported on this platform")
+
+        profiler = Profiler(os.path.join(config_dir, "profiles"), PROFILE_SECONDS, PROFILE_MODE)
+        try:
+            loop.add_signal_handler(signal.SIGUSR1, profiler.toggle)
+        except (NotImplementedError, AttributeError):
+            _LOG.debug("SIGUSR1 profiling not supported on this platform")
+        if PROFILE_SOCKET:
+            try:
+                await profiler.serve(PROFILE_SOCKET)
+            except (OSError, NotImplementedError, AttributeError) as e:
+                _LOG.warning("Cannot open profiler control socket %s: %s", PROFILE_SOCKET, e)
+
         if not config.is_configured():
             _LOG.info("Device not configured, waiting for setup...")
             await api.set_device_state(DeviceStates.DISCONNECTED)
 
         _LOG.info("Emotiva integration driver started successfully")
+        timeline.report("driver ready")
         await asyncio.Future()
         
     except Exception as e:
         _LOG.critical("Fatal error in main: %s", e, exc_info=True)
     finally:
         _LOG.info("Shutting down Emotiva integration")
-        
-        for client in clients.values():
-            try:
-                await client.unsubscribe_events()
-                await client.close()
-            except Exception as e:
-                _LOG.error(f"Error closing client: {e}")
+        if retry_task:
+            retry_task.cancel()
+        if profiler:
+            profiler.close()
+        await _shutdown_clients(SHUTDOWN_TIMEOUT)
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        runtime.run(main())
     except KeyboardInterrupt:
         _LOG.info("Integration stopped by user")
     except Exception as e:
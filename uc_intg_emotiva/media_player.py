@@ -13,12 +13,17 @@ from ucapi import MediaPlayer, StatusCodes
 
 from uc_intg_emotiva.client import EmotivaClient
 from uc_intg_emotiva.config import DeviceConfig
+from uc_intg_emotiva.profiling import hot_path
+from uc_intg_emotiva.tracing import span, traced_command
 
 _LOG = logging.getLogger(__name__)
 
 
 class EmotivaMediaPlayer(MediaPlayer):
     
+    SYNC_EVENTS = ("power", "volume", "source", "mode")
+    NOTIFY_EVENTS = ("power", "volume", "source", "mode") + tuple(f"input_{i}" for i in range(1, 9))
+    
     def __init__(self, client: EmotivaClient, device_config: DeviceConfig, api: ucapi.IntegrationAPI):
         self._client = client
         self._device_config = device_config
@@ -63,7 +68,7 @@ class EmotivaMediaPlayer(MediaPlayer):
             cmd_handler=self.handle_command
         )
         
-        self._client.set_notify_callback(self._on_device_update)
+        self._client.add_notify_callback(self._on_device_update)
         
         _LOG.info(f"Created media player entity: {entity_id}")
 
@@ -72,10 +77,13 @@ class EmotivaMediaPlayer(MediaPlayer):
         
         try:
             power_state = self._client.power
-            state = ucapi.media_player.States.ON if power_state else ucapi.media_player.States.OFF
+            if not self._client.available:
+                state = ucapi.media_player.States.UNAVAILABLE
+            else:
+                state = ucapi.media_player.States.ON if power_state else ucapi.media_player.States.OFF
             
             volume_level = self._client.volume_level
-            volume = int(volume_level * 100) if volume_level is not None else 0
+            volume = round(volume_level * 100) if volume_level is not None else 0
             
             muted = self._client.mute
             source = self._client.source or ""
@@ -91,25 +99,29 @@ class EmotivaMediaPlayer(MediaPlayer):
                 ucapi.media_player.Attributes.SOUND_MODE_LIST: list(self._client.all_modes),
             }
             
-            self.attributes.update(new_attributes)
+            changed = {key: value for key, value in new_attributes.items() if self.attributes.get(key) != value}
+            if not changed:
+                return
+            
+            self.attributes.update(changed)
             
             if self._api and self._api.configured_entities.contains(self.id):
-                self._api.configured_entities.update_attributes(self.id, new_attributes)
+                with span("update_attributes", entity_id=self.id):
+                    self._api.configured_entities.update_attributes(self.id, changed)
                 _LOG.info(f"Media player state updated: power={power_state}, volume={volume}, muted={muted}, source={source}, mode={mode}")
         
         except Exception as e:
             _LOG.error(f"Error in device update callback: {e}", exc_info=True)
 
-    async def push_update(self):
-        try:
-            await self._client.update_events(["power", "volume", "source", "mode"])
-            self._on_device_update()
-        except Exception as e:
-            _LOG.error(f"Error pushing update: {e}")
-
+    @traced_command
+    @hot_path
     async def handle_command(self, entity: ucapi.Entity, cmd_id: str, params: dict[str, Any] | None) -> StatusCodes:
         _LOG.info(f"Media player command: {cmd_id} with params: {params}")
         
+        if not self._client.available:
+            _LOG.warning(f"{self._client.name} is unavailable, rejecting {cmd_id}")
+            return StatusCodes.SERVICE_UNAVAILABLE
+        
         try:
             if cmd_id == ucapi.media_player.Commands.ON:
                 await self._client.power_on()
@@ -125,10 +137,7 @@ class EmotivaMediaPlayer(MediaPlayer):
             
             elif cmd_id == ucapi.media_player.Commands.VOLUME:
                 if params and "volume" in params:
-                    volume_percent = float(params["volume"])
-                    volume_level = volume_percent / 100.0
-                    actual_volume = (volume_level * self._client._volume_range) + self._client._volume_min
-                    await self._client.set_volume(actual_volume)
+                    await self._client.set_volume_percent(float(params["volume"]))
                     return StatusCodes.OK
                 return StatusCodes.BAD_REQUEST
             
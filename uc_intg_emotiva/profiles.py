@@ -0,0 +1,199 @@
+"""
+Emotiva model profiles.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Tuple
+
+_LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    name: str
+    modes: Mapping[str, Tuple[str, str]]
+    trims: Mapping[str, str]
+    sources: Mapping[str, str]
+    volume_min: float = -80.0
+    volume_max: float = 11.0
+    features: FrozenSet[str] = frozenset()
+    zone2_sources: Mapping[str, str] = field(default_factory=lambda: _ZONE2_SOURCES)
+    mode_tags: Mapping[str, Tuple[str, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "modes", MappingProxyType(dict(self.modes)))
+        object.__setattr__(self, "trims", MappingProxyType(dict(self.trims)))
+        object.__setattr__(self, "sources", MappingProxyType(dict(self.sources)))
+        object.__setattr__(self, "zone2_sources", MappingProxyType(dict(self.zone2_sources)))
+        object.__setattr__(self, "features", frozenset(self.features))
+        
+        mode_tags: Dict[str, Tuple[str, ...]] = {}
+        for mode_name, (_, tag) in self.modes.items():
+            mode_tags[tag] = mode_tags.get(tag, ()) + (mode_name,)
+        object.__setattr__(self, "mode_tags", MappingProxyType(mode_tags))
+
+    def has_feature(self, feature: str) -> bool:
+        return feature in self.features
+
+
+_BASE_MODES = {
+    "Stereo": ("stereo", "mode_stereo"),
+    "Direct": ("direct", "mode_direct"),
+    "Dolby": ("dolby", "mode_dolby"),
+    "DTS": ("dts", "mode_dts"),
+    "All Stereo": ("all_stereo", "mode_all_stereo"),
+    "Auto": ("auto", "mode_auto"),
+    "Reference Stereo": ("reference_stereo", "mode_ref_stereo"),
+    "Surround": ("surround_mode", "mode_surround"),
+}
+
+_BASE_TRIMS = {
+    "center": "Center",
+    "subwoofer": "Subwoofer",
+    "surround": "Surround",
+    "back": "Back",
+}
+
+_IMMERSIVE_TRIMS = {
+    **_BASE_TRIMS,
+    "width": "Width",
+    "height": "Height",
+}
+
+_SOURCES = {
+    "source_1": "Input 1", "source_2": "Input 2", "source_3": "Input 3",
+    "source_4": "Input 4", "source_5": "Input 5", "source_6": "Input 6",
+    "source_7": "Input 7", "source_8": "Input 8",
+    "analog1": "Analog 1", "analog2": "Analog 2", "analog3": "Analog 3",
+    "analog4": "Record In", "analog5": "Analog 5", "analog71": "Analog 7.1",
+    "ARC": "HDMI ARC",
+    "coax1": "Coax 1", "coax2": "Coax 2", "coax3": "Coax 3", "coax4": "AES/EBU",
+    "hdmi1": "HDMI 1", "hdmi2": "HDMI 2", "hdmi3": "HDMI 3", "hdmi4": "HDMI 4",
+    "hdmi5": "HDMI 5", "hdmi6": "HDMI 6", "hdmi7": "HDMI 7", "hdmi8": "HDMI 8",
+    "optical1": "Optical 1", "optical2": "Optical 2", "optical3": "Optical 3", "optical4": "Optical 4",
+    "source_tuner": "Tuner", "usb_stream": "USB Stream",
+}
+
+_ZONE2_SOURCES = {
+    "zone2_follow_main": "Follow Main",
+    "zone2_analog1": "Analog 1", "zone2_analog2": "Analog 2", "zone2_analog3": "Analog 3",
+    "zone2_analog4": "Record In", "zone2_analog5": "Analog 5", "zone2_analog71": "Analog 7.1",
+    "zone2_ARC": "HDMI ARC",
+    "zone2_coax1": "Coax 1", "zone2_coax2": "Coax 2", "zone2_coax3": "Coax 3", "zone2_coax4": "AES/EBU",
+    "zone2_optical1": "Optical 1", "zone2_optical2": "Optical 2",
+    "zone2_optical3": "Optical 3", "zone2_optical4": "Optical 4",
+    "zone2_usb_stream": "USB Stream",
+}
+
+DEFAULT_PROFILE = ModelProfile(
+    name="Generic",
+    modes=_BASE_MODES,
+    trims=_BASE_TRIMS,
+    sources=_SOURCES,
+    features={"zone2"},
+)
+
+_PROFILES: Dict[str, ModelProfile] = {
+    "XMC1": ModelProfile(
+        name="XMC-1",
+        modes={
+            **_BASE_MODES,
+            "PLIIx Music": ("dolby", "mode_dolby"),
+            "PLIIx Movie": ("dolby", "mode_dolby"),
+            "dts Neo:6 Cinema": ("dts", "mode_dts"),
+            "dts Neo:6 Music": ("dts", "mode_dts"),
+        },
+        trims=_BASE_TRIMS,
+        sources=_SOURCES,
+        volume_min=-96.0,
+        volume_max=11.0,
+        features={"zone2", "tuner"},
+    ),
+    "XMC2": ModelProfile(
+        name="XMC-2",
+        modes={
+            **_BASE_MODES,
+            "Dolby ATMOS": ("dolby", "mode_dolby"),
+            "dts Neural:X": ("dts", "mode_dts"),
+            "Dolby Surround": ("dolby", "mode_dolby"),
+        },
+        trims=_IMMERSIVE_TRIMS,
+        sources=_SOURCES,
+        volume_min=-96.0,
+        volume_max=11.0,
+        features={"zone2"},
+    ),
+    "RMC1": ModelProfile(
+        name="RMC-1",
+        modes={
+            **_BASE_MODES,
+            "Dolby Surround": ("dolby", "mode_dolby"),
+            "Dolby ATMOS": ("dolby", "mode_dolby"),
+            "dts Neural:X": ("dts", "mode_dts"),
+        },
+        trims=_IMMERSIVE_TRIMS,
+        sources=_SOURCES,
+        volume_min=-96.0,
+        volume_max=11.0,
+        features={"zone2"},
+    ),
+}
+_PROFILES["RMC1L"] = replace(_PROFILES["RMC1"], name="RMC-1L")
+
+
+def normalize_model(model: str) -> str:
+    return (model or "").replace(" ", "").replace("-", "").replace("_", "").upper()
+
+
+@lru_cache(maxsize=None)
+def _lookup_profile(normalized_model: str) -> ModelProfile:
+    for key in sorted(_PROFILES, key=len, reverse=True):
+        if normalized_model.startswith(key):
+            return _PROFILES[key]
+    return DEFAULT_PROFILE
+
+
+def get_model_profile(model: str) -> ModelProfile:
+    return _lookup_profile(normalize_model(model))
+
+
+def _profile_from_dict(name: str, data: Dict[str, Any]) -> ModelProfile:
+    base = _PROFILES.get(normalize_model(data.get("base", "")), DEFAULT_PROFILE)
+    modes = data.get("modes")
+    return ModelProfile(
+        name=data.get("name", name),
+        modes={mode: tuple(value) for mode, value in modes.items()} if modes is not None else base.modes,
+        trims=data.get("trims", base.trims),
+        sources=data.get("sources", base.sources),
+        zone2_sources=data.get("zone2_sources", base.zone2_sources),
+        volume_min=float(data.get("volume_min", base.volume_min)),
+        volume_max=float(data.get("volume_max", base.volume_max)),
+        features=data.get("features", base.features),
+    )
+
+
+def load_profile_overrides(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        
+        for model, profile_data in data.items():
+            _PROFILES[normalize_model(model)] = _profile_from_dict(model, profile_data)
+    except Exception as e:
+        _LOG.error(f"Failed to load model profiles from {path}: {e}")
+        return 0
+
+    _lookup_profile.cache_clear()
+    _LOG.info(f"Loaded {len(data)} model profile(s) from {path}")
+    return len(data)
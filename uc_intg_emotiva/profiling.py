@@ -0,0 +1,248 @@
+"""
+On-demand profiling for a running Emotiva driver.
+
+A profile run is started with ``SIGUSR1`` (a second signal stops it early)
+or through the local control socket named by ``UC_EMOTIVA_PROFILE_SOCKET``,
+which accepts one command per connection::
+
+    start [seconds] [sampling|cprofile]
+    stop
+    status
+
+``sampling`` records the event loop thread's stack every few milliseconds
+and writes collapsed stacks (``.collapsed``, flame graph input);
+``cprofile`` traces every call and writes a pstats file (``.prof``). Each
+run also writes a ``.txt`` summary for the functions marked ``@hot_path``.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import stat
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+_LOG = logging.getLogger(__name__)
+
+PROFILE_MODES = ("sampling", "cprofile")
+
+HOT_PATHS: Dict[CodeType, str] = {}
+
+F = TypeVar("F", bound=Callable)
+
+
+def hot_path(func: F) -> F:
+    HOT_PATHS[func.__code__] = func.__qualname__
+    return func
+
+
+def _frame_label(code: CodeType) -> str:
+    return f"{os.path.basename(code.co_filename)}:{code.co_qualname}"
+
+
+class _Sampler:
+
+    INTERVAL = 0.005
+
+    def __init__(self, thread_id: int):
+        self._thread_id = thread_id
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="emotiva-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self._stacks
+
+    def _run(self):
+        while not self._stop.wait(self.INTERVAL):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                self._stacks[tuple(reversed(stack))] += 1
+
+
+class Profiler:
+
+    def __init__(self, output_dir: str, default_seconds: float = 30.0, default_mode: str = "sampling"):
+        self._output_dir = output_dir
+        self._default_seconds = default_seconds
+        self._default_mode = default_mode if default_mode in PROFILE_MODES else "sampling"
+        self._mode: Optional[str] = None
+        self._path: Optional[str] = None
+        self._profile: Optional[Any] = None
+        self._sampler: Optional[_Sampler] = None
+        self._stop_handle: Optional[asyncio.TimerHandle] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def running(self) -> bool:
+        return self._mode is not None
+
+    def toggle(self):
+        if self.running:
+            self.stop()
+            return
+        try:
+            self.start()
+        except (RuntimeError, ValueError) as e:
+            _LOG.error(f"Cannot start profiler: {e}")
+
+    def start(self, seconds: Optional[float] = None, mode: Optional[str] = None) -> str:
+        if self.running:
+            raise RuntimeError(f"profiler already running, writing to {self._path}")
+
+        mode = mode or self._default_mode
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unknown profile mode '{mode}'")
+        seconds = self._default_seconds if seconds is None else seconds
+
+        os.makedirs(self._output_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        suffix = ".collapsed" if mode == "sampling" else ".prof"
+        path = os.path.join(self._output_dir, f"profile-{stamp}{suffix}")
+
+        if mode == "cprofile":
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = _Sampler(threading.get_ident())
+            self._sampler.start()
+
+        self._mode = mode
+        self._path = path
+        self._stop_handle = asyncio.get_running_loop().call_later(seconds, self.stop)
+        _LOG.info(f"Profiling ({mode}) for {seconds:g}s, writing {path}")
+        return path
+
+    def stop(self) -> Optional[str]:
+        if not self.running:
+            return None
+
+        if self._stop_handle:
+            self._stop_handle.cancel()
+            self._stop_handle = None
+
+        path = self._path
+        try:
+            if self._mode == "cprofile":
+                self._profile.disable()
+                hot = self._write_pstats(path)
+            else:
+                hot = self._write_collapsed(path, self._sampler.stop())
+            self._write_summary(os.path.splitext(path)[0] + ".txt", hot)
+            _LOG.info(f"Profile written to {path}")
+        except Exception as e:
+            _LOG.error(f"Failed to write profile {path}: {e}")
+        finally:
+            self._mode = None
+            self._path = None
+            self._profile = None
+            self._sampler = None
+        return path
+
+    def _write_pstats(self, path: str) -> List[str]:
+        import pstats
+        self._profile.dump_stats(path)
+        stats = pstats.Stats(self._profile).stats
+        hot = []
+        for code, name in HOT_PATHS.items():
+            entry = stats.get((code.co_filename, code.co_firstlineno, code.co_name))
+            if entry is None:
+                continue
+            _, calls, own, cumulative, _ = entry
+            hot.append(
+                f"{name}: {calls} calls, {cumulative * 1000:.1f} ms cumulative, "
+                f"{cumulative / calls * 1e6:.1f} us/call, {own * 1000:.1f} ms own"
+            )
+        return hot
+
+    def _write_collapsed(self, path: str, stacks: Counter) -> List[str]:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in stacks.most_common():
+                f.write(";".join(_frame_label(code) for code in stack) + f" {count}\n")
+
+        total = sum(stacks.values())
+        inclusive: Counter = Counter()
+        for stack, count in stacks.items():
+            for code in set(stack) & HOT_PATHS.keys():
+                inclusive[code] += count
+        return [
+            f"{HOT_PATHS[code]}: {count} samples ({count / total:.1%} of {total})"
+            for code, count in inclusive.most_common()
+        ]
+
+    def _write_summary(self, path: str, hot: List[str]):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Hot paths:\n")
+            for line in hot or ["(none observed)"]:
+                f.write(f"  {line}\n")
+                _LOG.info(f"Hot path {line}")
+
+    async def serve(self, path: str):
+        try:
+            if not stat.S_ISSOCK(os.lstat(path).st_mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o077)
+        try:
+            sock.bind(path)
+        except BaseException:
+            sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        self._server = await asyncio.start_unix_server(self._handle_connection, sock=sock)
+        _LOG.info(f"Profiler control socket listening on {path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            line = await asyncio.wait_for(reader.readline(), 5.0)
+            writer.write((self._command(line.decode("utf-8", "replace").split()) + "\n").encode("utf-8"))
+            await writer.drain()
+        except Exception as e:
+            _LOG.debug(f"Profiler control connection failed: {e}")
+        finally:
+            writer.close()
+
+    def _command(self, args: List[str]) -> str:
+        command = args[0].lower() if args else "status"
+        try:
+            if command == "start":
+                seconds = float(args[1]) if len(args) > 1 else None
+                mode = args[2].lower() if len(args) > 2 else None
+                return f"started {self.start(seconds, mode)}"
+            if command == "stop":
+                path = self.stop()
+                return f"stopped {path}" if path else "idle"
+            if command == "status":
+                return f"running {self._mode} {self._path}" if self.running else "idle"
+            return f"error unknown command '{command}'"
+        except (RuntimeError, ValueError) as e:
+            return f"error {e}"
+
+    def close(self):
+        self.stop()
+        if self._server:
+            self._server.close()
+            self._server = None
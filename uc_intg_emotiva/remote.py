@@ -13,16 +13,26 @@ from ucapi import Remote, StatusCodes
 
 from uc_intg_emotiva.client import EmotivaClient
 from uc_intg_emotiva.config import DeviceConfig
+from uc_intg_emotiva.profiling import hot_path
+from uc_intg_emotiva.scenes import SceneRunner
+from uc_intg_emotiva.tracing import span, traced_command
 
 _LOG = logging.getLogger(__name__)
 
 
 class EmotivaRemote(Remote):
     
+    SYNC_EVENTS = ("power",)
+    BUTTON_EVENTS = ("power", "volume")
+    SCENE_EVENTS = ("power", "volume", "source", "mode")
+    
     def __init__(self, client: EmotivaClient, device_config: DeviceConfig, api: ucapi.IntegrationAPI):
         self._client = client
         self._device_config = device_config
         self._api = api
+        self._scenes = SceneRunner(client, device_config.scenes)
+        events = self.SCENE_EVENTS if device_config.scenes else self.BUTTON_EVENTS
+        self.NOTIFY_EVENTS = events + tuple(client.trim_channels)
         
         entity_id = f"remote_{device_config.device_id}"
         entity_name = f"{device_config.name} Remote"
@@ -48,7 +58,7 @@ class EmotivaRemote(Remote):
             cmd_handler=self.handle_command
         )
         
-        self._client.set_notify_callback(self._on_device_update)
+        self._client.add_notify_callback(self._on_device_update)
         
         _LOG.info(f"Created remote entity: {entity_id} with {len(simple_commands)} commands")
 
@@ -99,6 +109,10 @@ class EmotivaRemote(Remote):
                 commands.append(down_cmd)
                 _LOG.debug(f"Added trim buttons: {up_cmd}, {down_cmd}")
         
+        for scene_name in self._scenes.scene_names:
+            commands.append(f"scene_{scene_name}")
+            _LOG.debug(f"Added scene button: scene_{scene_name}")
+        
         _LOG.info(f"Built command list with {len(commands)} total commands")
         return commands
 
@@ -106,31 +120,38 @@ class EmotivaRemote(Remote):
         _LOG.debug(f"Remote update callback for {self.id}")
         
         try:
-            state = ucapi.remote.States.ON if self._client.power else ucapi.remote.States.OFF
+            if not self._client.available:
+                state = ucapi.remote.States.UNAVAILABLE
+            else:
+                state = ucapi.remote.States.ON if self._client.power else ucapi.remote.States.OFF
             
             new_attributes = {
                 ucapi.remote.Attributes.STATE: state,
             }
             
-            self.attributes.update(new_attributes)
+            changed = {key: value for key, value in new_attributes.items() if self.attributes.get(key) != value}
+            if not changed:
+                return
+            
+            self.attributes.update(changed)
             
             if self._api and self._api.configured_entities.contains(self.id):
-                self._api.configured_entities.update_attributes(self.id, new_attributes)
+                with span("update_attributes", entity_id=self.id):
+                    self._api.configured_entities.update_attributes(self.id, changed)
                 _LOG.info(f"Updated remote state: power={self._client.power}")
         
         except Exception as e:
             _LOG.error(f"Error in remote update callback: {e}", exc_info=True)
 
-    async def push_update(self):
-        try:
-            await self._client.update_events(["power"])
-            self._on_device_update()
-        except Exception as e:
-            _LOG.error(f"Error pushing remote update: {e}")
-
+    @traced_command
+    @hot_path
     async def handle_command(self, entity: ucapi.Entity, cmd_id: str, params: dict[str, Any] | None) -> StatusCodes:
         _LOG.info(f"Remote command: {cmd_id} with params: {params}")
         
+        if not self._client.available:
+            _LOG.warning(f"{self._client.name} is unavailable, rejecting {cmd_id}")
+            return StatusCodes.SERVICE_UNAVAILABLE
+        
         try:
             if cmd_id == ucapi.remote.Commands.ON:
                 await self._client.power_on()
@@ -174,6 +195,8 @@ class EmotivaRemote(Remote):
             await self._handle_mode_command(command)
         elif command.startswith("trim_"):
             await self._handle_trim_command(command)
+        elif command.startswith("scene_"):
+            self._scenes.start(command[len("scene_"):])
         else:
             await self._handle_basic_command(command)
 
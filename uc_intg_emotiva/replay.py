@@ -0,0 +1,103 @@
+"""
+Replay captured Emotiva notification traffic through the client parser.
+
+Usage: python -m uc_intg_emotiva.replay CAPTURE [--speed 1|N|max] [--model XMC-2]
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List
+
+from uc_intg_emotiva.capture import read_capture
+from uc_intg_emotiva.client import EmotivaClient
+from uc_intg_emotiva.config import DeviceConfig
+
+_LOG = logging.getLogger(__name__)
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percent / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def replay(path: str, speed: float = 0.0, model: str = "Unknown", repeat: int = 1) -> Dict[str, Any]:
+    records = list(read_capture(path))
+    client = EmotivaClient(DeviceConfig(
+        device_id="replay",
+        name="Replay",
+        ip_address="127.0.0.1",
+        model=model,
+    ))
+
+    latencies: List[float] = []
+    lags: List[float] = []
+    callbacks = 0
+
+    def on_update():
+        nonlocal callbacks
+        callbacks += 1
+
+    client.add_notify_callback(on_update)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        base_ts = records[0][0] if records else 0.0
+        pass_start = time.perf_counter()
+
+        for timestamp, data in records:
+            if speed > 0:
+                due = pass_start + (timestamp - base_ts) / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lags.append(time.perf_counter() - due)
+
+            t0 = time.perf_counter()
+            client.handle_notification(data)
+            latencies.append(time.perf_counter() - t0)
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    lags.sort()
+
+    return {
+        "datagrams": len(latencies),
+        "elapsed_s": elapsed,
+        "throughput_pps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "callbacks": callbacks,
+        "suppressed": client.suppressed_updates,
+        "latency_us": {p: _percentile(latencies, p) * 1e6 for p in (50, 90, 99, 99.9)},
+        "lag_ms": {p: _percentile(lags, p) * 1e3 for p in (50, 90, 99)} if lags else {},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay captured Emotiva notifications")
+    parser.add_argument("capture", help="capture file written with UC_EMOTIVA_CAPTURE_DIR")
+    parser.add_argument("--speed", default="max", help="playback speed: 1, N (e.g. 10) or max")
+    parser.add_argument("--model", default="Unknown", help="model profile to parse with")
+    parser.add_argument("--repeat", type=int, default=1, help="number of passes over the capture")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    speed = 0.0 if args.speed == "max" else float(args.speed)
+    result = asyncio.run(replay(args.capture, speed, args.model, args.repeat))
+
+    print(f"datagrams:  {result['datagrams']}")
+    print(f"elapsed:    {result['elapsed_s']:.3f} s")
+    print(f"throughput: {result['throughput_pps']:.0f} datagrams/s")
+    print(f"callbacks:  {result['callbacks']} (suppressed {result['suppressed']})")
+    print("latency:    " + ", ".join(f"p{p}={v:.1f}us" for p, v in result["latency_us"].items()))
+    if result["lag_ms"]:
+        print("sched lag:  " + ", ".join(f"p{p}={v:.2f}ms" for p, v in result["lag_ms"].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Event loop backend selection.
+
+Set ``UC_EMOTIVA_LOOP`` to ``uvloop`` (or ``auto``) to run the driver on
+uvloop when it is installed; the stock asyncio loop is used otherwise.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Coroutine, Optional, Tuple
+
+_LOG = logging.getLogger(__name__)
+
+LOOP_BACKENDS = ("asyncio", "uvloop", "auto")
+
+
+def loop_factory(backend: Optional[str] = None) -> Tuple[str, Optional[Callable[[], asyncio.AbstractEventLoop]]]:
+    backend = (backend or os.getenv("UC_EMOTIVA_LOOP", "asyncio")).strip().lower()
+    if backend not in LOOP_BACKENDS:
+        _LOG.warning(f"Unknown event loop backend '{backend}', using asyncio")
+        return "asyncio", None
+
+    if backend == "asyncio":
+        return "asyncio", None
+
+    try:
+        import uvloop
+    except ImportError:
+        if backend == "uvloop":
+            _LOG.warning("uvloop requested but not installed, using asyncio")
+        return "asyncio", None
+
+    return "uvloop", uvloop.new_event_loop
+
+
+def run(main: Coroutine[Any, Any, Any], backend: Optional[str] = None) -> Any:
+    _, factory = loop_factory(backend)
+    with asyncio.Runner(loop_factory=factory) as runner:
+        return runner.run(main)
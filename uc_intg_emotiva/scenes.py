@@ -0,0 +1,158 @@
+"""
+Scene engine for multi-step Emotiva command sequences.
+
+A scene is a list of steps stored per device in ``config.json``::
+
+    "scenes": {
+        "movie_night": [
+            {"power": true},
+            {"parallel": [{"source": "HDMI 1"}, {"mode": "Dolby ATMOS"}]},
+            {"volume": -35}
+        ]
+    }
+
+Supported steps: ``power``, ``source``, ``mode``, ``volume``, ``mute``,
+``command`` (with optional ``value``), ``delay`` (ms) and ``parallel``.
+Any step may carry ``when`` (state conditions that must hold for the step
+to run) and ``timeout`` (seconds to wait for the device to confirm).
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Set
+
+from uc_intg_emotiva.client import EmotivaClient
+
+_LOG = logging.getLogger(__name__)
+
+POWER_TIMEOUT = 10.0
+STEP_TIMEOUT = 3.0
+
+
+class SceneRunner:
+
+    def __init__(self, client: EmotivaClient, scenes: Dict[str, List[Dict[str, Any]]]):
+        self._client = client
+        self._scenes = scenes
+        self._lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def scene_names(self) -> List[str]:
+        return list(self._scenes.keys())
+
+    def start(self, name: str) -> bool:
+        if name not in self._scenes:
+            _LOG.warning(f"Unknown scene: {name}")
+            return False
+        
+        task = asyncio.create_task(self.run(name))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_scene_done)
+        return True
+
+    def _on_scene_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            _LOG.error(f"Scene on {self._client.name} failed: {task.exception()}")
+
+    async def run(self, name: str) -> bool:
+        steps = self._scenes.get(name)
+        if steps is None:
+            _LOG.warning(f"Unknown scene: {name}")
+            return False
+        
+        async with self._lock:
+            _LOG.info(f"Running scene '{name}' on {self._client.name} ({len(steps)} steps)")
+            for step in steps:
+                if not await self._run_step(step):
+                    _LOG.warning(f"Scene '{name}' aborted at step {step}")
+                    return False
+            _LOG.info(f"Scene '{name}' completed")
+            return True
+
+    async def _run_step(self, step: Dict[str, Any]) -> bool:
+        when = step.get("when")
+        if when and not self._client.matches_state(when):
+            _LOG.debug(f"Skipping step {step}: conditions {when} not met")
+            return True
+        
+        if "parallel" in step:
+            results = await asyncio.gather(*(self._run_step(sub) for sub in step["parallel"]))
+            return all(results)
+        
+        if "power" in step:
+            return await self._power_step(bool(step["power"]), step.get("timeout", POWER_TIMEOUT))
+        
+        timeout = step.get("timeout", STEP_TIMEOUT)
+        
+        if "source" in step:
+            await self._source_step(step["source"], timeout)
+        elif "mode" in step:
+            await self._mode_step(step["mode"], timeout)
+        elif "volume" in step:
+            await self._volume_step(float(step["volume"]), timeout)
+        elif "mute" in step:
+            await self._mute_step(bool(step["mute"]), timeout)
+        elif "command" in step:
+            await self._client.send_command(step["command"], step.get("value", "0"))
+        elif "delay" in step:
+            await asyncio.sleep(float(step["delay"]) / 1000.0)
+        else:
+            _LOG.warning(f"Unknown scene step: {step}")
+        
+        return True
+
+    async def _power_step(self, power: bool, timeout: float) -> bool:
+        if self._client.power == power:
+            return True
+        
+        if power:
+            await self._client.power_on()
+        else:
+            await self._client.power_off()
+        
+        if not await self._client.wait_for(power=power, timeout=timeout):
+            _LOG.warning(f"{self._client.name} did not confirm power {'on' if power else 'off'} within {timeout}s")
+            return False
+        
+        if power:
+            await self._client.wait_until_ready(timeout)
+        return True
+
+    async def _source_step(self, source: str, timeout: float):
+        if self._client.source == source:
+            return
+        
+        previous = self._client.source
+        if source in self._client.sources:
+            await self._client.set_source(source)
+        else:
+            await self._client.set_source_by_command(source)
+        
+        await self._client.wait_for(source=lambda value: value != previous, timeout=timeout)
+
+    async def _mode_step(self, mode: str, timeout: float):
+        if self._client.mode == mode:
+            return
+        
+        previous = self._client.mode
+        await self._client.set_mode(mode)
+        await self._client.wait_for(mode=lambda value: value != previous, timeout=timeout)
+
+    async def _volume_step(self, volume: float, timeout: float):
+        if self._client.volume == volume:
+            return
+        
+        await self._client.set_volume(volume)
+        await self._client.wait_for(volume=volume, timeout=timeout)
+
+    async def _mute_step(self, mute: bool, timeout: float):
+        if self._client.mute == mute:
+            return
+        
+        await self._client.set_mute(mute)
+        await self._client.wait_for(mute=mute, timeout=timeout)
@@ -0,0 +1,127 @@
+"""
+Emotiva signal sensor entities for Unfolded Circle integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import ucapi
+from ucapi import Sensor
+
+from uc_intg_emotiva.client import EmotivaClient
+from uc_intg_emotiva.config import DeviceConfig
+from uc_intg_emotiva.tracing import span
+
+_LOG = logging.getLogger(__name__)
+
+SIGNAL_SENSORS = {
+    "audio_input": "Audio Input",
+    "audio_bitstream": "Audio Bitstream",
+    "audio_bits": "Audio Bits",
+    "video_input": "Video Input",
+    "video_format": "Video Format",
+    "video_space": "Video Color Space",
+}
+
+
+class EmotivaSignalSensor(Sensor):
+
+    SETTLE_TIME = 0.3
+
+    def __init__(self, client: EmotivaClient, device_config: DeviceConfig, api: ucapi.IntegrationAPI, prop: str):
+        self._client = client
+        self._device_config = device_config
+        self._api = api
+        self._property = prop
+        self._published_value: Optional[str] = None
+        self._published_available = True
+        self._pending_publish: Optional[asyncio.TimerHandle] = None
+
+        self.SYNC_EVENTS = (prop,)
+        self.NOTIFY_EVENTS = (prop,)
+
+        entity_id = f"sensor_{device_config.device_id}_{prop}"
+        entity_name = f"{device_config.name} {SIGNAL_SENSORS[prop]}"
+
+        attributes = {
+            ucapi.sensor.Attributes.STATE: ucapi.sensor.States.UNKNOWN,
+            ucapi.sensor.Attributes.VALUE: "",
+        }
+
+        super().__init__(
+            entity_id,
+            entity_name,
+            [],
+            attributes,
+            device_class=ucapi.sensor.DeviceClasses.CUSTOM,
+        )
+
+        self._client.add_notify_callback(self._on_device_update)
+
+        _LOG.info(f"Created sensor entity: {entity_id}")
+
+    def _on_device_update(self):
+        value = self._client.current_state.get(self._property)
+
+        if self._client.available != self._published_available:
+            self._publish()
+            return
+
+        if value == self._published_value:
+            if self._pending_publish:
+                self._pending_publish.cancel()
+                self._pending_publish = None
+            return
+
+        if self._published_value is None:
+            self._publish()
+            return
+
+        if self._pending_publish:
+            self._pending_publish.cancel()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._publish()
+            return
+
+        self._pending_publish = loop.call_later(self.SETTLE_TIME, self._publish)
+
+    def _publish(self):
+        if self._pending_publish:
+            self._pending_publish.cancel()
+        self._pending_publish = None
+        value = self._client.current_state.get(self._property)
+        available = self._client.available
+
+        if value == self._published_value and available == self._published_available:
+            return
+
+        self._published_value = value
+        self._published_available = available
+
+        try:
+            if not available:
+                state = ucapi.sensor.States.UNAVAILABLE
+            else:
+                state = ucapi.sensor.States.ON if value else ucapi.sensor.States.UNKNOWN
+
+            new_attributes = {
+                ucapi.sensor.Attributes.STATE: state,
+                ucapi.sensor.Attributes.VALUE: value or "",
+            }
+
+            self.attributes.update(new_attributes)
+
+            if self._api and self._api.configured_entities.contains(self.id):
+                with span("update_attributes", entity_id=self.id):
+                    self._api.configured_entities.update_attributes(self.id, new_attributes)
+                _LOG.info(f"Sensor {self.id} updated: {value}")
+
+        except Exception as e:
+            _LOG.error(f"Error in sensor update callback: {e}", exc_info=True)
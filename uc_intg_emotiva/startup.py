@@ -0,0 +1,63 @@
+"""
+Startup timeline for the Emotiva driver.
+
+Boot phases and per-device bring-up stages are recorded against the time
+the driver module started importing and logged once the driver is ready.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+_LOG = logging.getLogger(__name__)
+
+
+class StartupTimeline:
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._entries: List[Tuple[str, float, Optional[float]]] = []
+        self._reported = False
+
+    @property
+    def origin(self) -> float:
+        return self._origin
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._origin
+
+    def record(self, name: str, started: float):
+        if not self._reported:
+            self._entries.append((name, started - self._origin, time.perf_counter() - started))
+
+    def milestone(self, name: str):
+        if not self._reported:
+            self._entries.append((name, self.elapsed, None))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    def report(self, milestone: str):
+        if self._reported:
+            return
+        self._reported = True
+
+        _LOG.info("Startup timeline: %s after %.1f ms", milestone, self.elapsed * 1000)
+        for name, offset, duration in sorted(self._entries, key=lambda entry: entry[1]):
+            if duration is None:
+                _LOG.info("  %+9.1f ms  %9s  %s", offset * 1000, "", name)
+            else:
+                _LOG.info("  %+9.1f ms  %6.1f ms  %s", offset * 1000, duration * 1000, name)
+
+
+timeline = StartupTimeline()
@@ -0,0 +1,255 @@
+"""
+Command tracing from entity command to confirmed state.
+
+A trace starts when an entity handles a command and collects spans as the
+command moves through the client (``send_command``, each ``udp_send``), the
+first notification from the processor that changes the state the command
+targets, and the ``update_attributes`` calls that publish that state. Completed
+traces are kept in a ring buffer and can be exported as JSON.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+_LOG = logging.getLogger(__name__)
+
+_active: ContextVar[Tuple["Trace", ...]] = ContextVar("emotiva_trace", default=())
+_NULL = nullcontext()
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    duration: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "start_ms": round(self.start * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        return data
+
+
+class Trace:
+
+    def __init__(self, trace_id: str, entity_id: str, command: str, params: Optional[Dict[str, Any]]):
+        self.trace_id = trace_id
+        self.entity_id = entity_id
+        self.command = command
+        self.params = params
+        self.status = "running"
+        self.spans: List[Span] = []
+        self.keys: Set[str] = set()
+        self.confirmed = False
+        self.handled = False
+        self.expiry: Optional[asyncio.TimerHandle] = None
+        self._started = time.perf_counter()
+        self._started_at = time.time()
+        self._finished: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished is not None
+
+    @property
+    def duration(self) -> float:
+        end = self._finished if self._finished is not None else time.perf_counter()
+        return end - self._started
+
+    def add(self, name: str, started: float, finished: float, attributes: Dict[str, Any]):
+        if self._finished is None:
+            self.spans.append(Span(name, started - self._started, finished - started, attributes))
+
+    def matches(self, changed: Set[str]) -> bool:
+        return not self.keys or not self.keys.isdisjoint(changed)
+
+    def finish(self, status: str):
+        self.status = status
+        self._finished = time.perf_counter()
+        if self.expiry:
+            self.expiry.cancel()
+            self.expiry = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "entity_id": self.entity_id,
+            "command": self.command,
+            "params": self.params,
+            "status": self.status,
+            "started_at": self._started_at,
+            "duration_ms": round(self.duration * 1000, 3),
+            "spans": [span.to_dict() for span in sorted(self.spans, key=lambda span: span.start)],
+        }
+
+
+@contextmanager
+def _record(traces: Tuple[Trace, ...], name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        attributes["error"] = type(e).__name__
+        raise
+    finally:
+        finished = time.perf_counter()
+        for trace in traces:
+            trace.add(name, started, finished, attributes)
+
+
+def span(name: str, **attributes):
+    traces = _active.get()
+    if not traces:
+        return _NULL
+    return _record(traces, name, attributes)
+
+
+def expect(*keys: str):
+    for trace in _active.get():
+        trace.keys.update(keys)
+
+
+class Tracer:
+
+    CAPACITY = 256
+    CONFIRM_TIMEOUT = 5.0
+
+    def __init__(self, capacity: int = CAPACITY):
+        self._traces: Deque[Trace] = deque(maxlen=max(1, capacity))
+        self._enabled = capacity > 0
+        self._pending: Dict[Any, List[Trace]] = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def configure(self, capacity: int):
+        self._enabled = capacity > 0
+        self._traces = deque(self._traces, maxlen=max(1, capacity))
+
+    async def run_command(self, entity_id: str, command: str, params: Optional[Dict[str, Any]],
+                          handler: Callable[[], Any]) -> Any:
+        if not self._enabled:
+            return await handler()
+
+        trace = Trace(f"{next(self._ids):08x}", entity_id, command, params)
+        token = _active.set((trace,))
+        try:
+            with _record((trace,), "handle_command", {"entity_id": entity_id}):
+                result = await handler()
+        except BaseException:
+            self._discard_pending(trace)
+            self._complete(trace, "error")
+            raise
+        finally:
+            _active.reset(token)
+            trace.handled = True
+
+        ok = getattr(result, "name", result) == "OK"
+        if trace.confirmed:
+            self._complete(trace, "confirmed")
+        elif not ok:
+            self._discard_pending(trace)
+            self._complete(trace, f"rejected ({getattr(result, 'name', result)})")
+        elif any(trace in traces for traces in self._pending.values()):
+            trace.expiry = asyncio.get_running_loop().call_later(self.CONFIRM_TIMEOUT, self._expire, trace)
+        else:
+            self._complete(trace, "completed")
+        return result
+
+    def sent(self, source: Any):
+        for trace in _active.get():
+            if trace.finished or trace.confirmed:
+                continue
+            pending = self._pending.setdefault(source, [])
+            if trace not in pending:
+                pending.append(trace)
+
+    def confirm(self, source: Any, changed: Set[str]):
+        pending = self._pending.get(source)
+        if not pending:
+            return _NULL
+        traces = tuple(trace for trace in pending if trace.matches(changed))
+        if not traces:
+            return _NULL
+        if len(traces) == len(pending):
+            del self._pending[source]
+        else:
+            self._pending[source] = [trace for trace in pending if trace not in traces]
+        return self._confirm(traces, sorted(changed))
+
+    @contextmanager
+    def _confirm(self, traces: Tuple[Trace, ...], changed: List[str]) -> Iterator[None]:
+        now = time.perf_counter()
+        for trace in traces:
+            trace.confirmed = True
+            trace.add("notification", now, now, {"changed": changed})
+
+        token = _active.set(traces)
+        try:
+            yield
+        finally:
+            _active.reset(token)
+            for trace in traces:
+                if trace.handled:
+                    self._complete(trace, "confirmed")
+
+    def _discard_pending(self, trace: Trace):
+        for source, traces in list(self._pending.items()):
+            if trace in traces:
+                traces.remove(trace)
+                if not traces:
+                    del self._pending[source]
+
+    def _expire(self, trace: Trace):
+        trace.expiry = None
+        self._discard_pending(trace)
+        self._complete(trace, "unconfirmed")
+
+    def _complete(self, trace: Trace, status: str):
+        if trace.finished:
+            return
+        trace.finish(status)
+        self._traces.append(trace)
+        _LOG.debug(f"Trace {trace.trace_id} {trace.entity_id} {trace.command}: {status} "
+                   f"in {trace.duration * 1000:.1f} ms")
+
+    def export(self) -> List[Dict[str, Any]]:
+        return [trace.to_dict() for trace in self._traces]
+
+    def dump(self, output_dir: str) -> str:
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, f"traces-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.export(), f, indent=2, default=str)
+        _LOG.info(f"Wrote {len(self._traces)} command traces to {path}")
+        return path
+
+
+tracer = Tracer()
+
+
+def traced_command(func: Callable) -> Callable:
+    @functools.wraps(func)
+    async def wrapper(self, entity, cmd_id: str, params: Optional[Dict[str, Any]] = None):
+        return await tracer.run_command(self.id, cmd_id, params, lambda: func(self, entity, cmd_id, params))
+    return wrapper
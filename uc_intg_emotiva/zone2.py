@@ -0,0 +1,163 @@
+"""
+Emotiva Zone 2 Media Player entity for Unfolded Circle integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import logging
+from typing import Any
+
+import ucapi
+from ucapi import MediaPlayer, StatusCodes
+
+from uc_intg_emotiva.client import EmotivaClient
+from uc_intg_emotiva.config import DeviceConfig
+from uc_intg_emotiva.profiling import hot_path
+from uc_intg_emotiva.tracing import span, traced_command
+
+_LOG = logging.getLogger(__name__)
+
+
+class EmotivaZone2MediaPlayer(MediaPlayer):
+
+    SYNC_EVENTS = ("zone2_power", "zone2_volume", "zone2_input")
+    NOTIFY_EVENTS = SYNC_EVENTS
+
+    def __init__(self, client: EmotivaClient, device_config: DeviceConfig, api: ucapi.IntegrationAPI):
+        self._client = client
+        self._device_config = device_config
+        self._api = api
+        
+        entity_id = f"mp_{device_config.device_id}_zone2"
+        entity_name = f"{device_config.name} Zone 2"
+        
+        features = [
+            ucapi.media_player.Features.ON_OFF,
+            ucapi.media_player.Features.TOGGLE,
+            ucapi.media_player.Features.VOLUME,
+            ucapi.media_player.Features.VOLUME_UP_DOWN,
+            ucapi.media_player.Features.MUTE_TOGGLE,
+            ucapi.media_player.Features.MUTE,
+            ucapi.media_player.Features.UNMUTE,
+            ucapi.media_player.Features.SELECT_SOURCE,
+        ]
+        
+        attributes = {
+            ucapi.media_player.Attributes.STATE: ucapi.media_player.States.OFF,
+            ucapi.media_player.Attributes.VOLUME: 0,
+            ucapi.media_player.Attributes.MUTED: False,
+            ucapi.media_player.Attributes.SOURCE: "",
+            ucapi.media_player.Attributes.SOURCE_LIST: list(client.zone2_sources),
+        }
+        
+        options = {
+            ucapi.media_player.Options.VOLUME_STEPS: 100
+        }
+        
+        super().__init__(
+            entity_id,
+            entity_name,
+            features,
+            attributes,
+            device_class=ucapi.media_player.DeviceClasses.RECEIVER,
+            options=options,
+            cmd_handler=self.handle_command
+        )
+        
+        self._client.add_notify_callback(self._on_device_update)
+        
+        _LOG.info(f"Created zone 2 media player entity: {entity_id}")
+
+    def _on_device_update(self):
+        try:
+            if not self._client.available:
+                state = ucapi.media_player.States.UNAVAILABLE
+            else:
+                state = ucapi.media_player.States.ON if self._client.zone2_power else ucapi.media_player.States.OFF
+            
+            volume_level = self._client.zone2_volume_level
+            volume = round(volume_level * 100) if volume_level is not None else 0
+            
+            new_attributes = {
+                ucapi.media_player.Attributes.STATE: state,
+                ucapi.media_player.Attributes.VOLUME: volume,
+                ucapi.media_player.Attributes.MUTED: self._client.zone2_mute,
+                ucapi.media_player.Attributes.SOURCE: self._client.zone2_source or "",
+            }
+            
+            changed = {key: value for key, value in new_attributes.items() if self.attributes.get(key) != value}
+            if not changed:
+                return
+            
+            self.attributes.update(changed)
+            
+            if self._api and self._api.configured_entities.contains(self.id):
+                with span("update_attributes", entity_id=self.id):
+                    self._api.configured_entities.update_attributes(self.id, changed)
+                _LOG.info(f"Zone 2 state updated: {changed}")
+        
+        except Exception as e:
+            _LOG.error(f"Error in zone 2 update callback: {e}", exc_info=True)
+
+    @traced_command
+    @hot_path
+    async def handle_command(self, entity: ucapi.Entity, cmd_id: str, params: dict[str, Any] | None) -> StatusCodes:
+        _LOG.info(f"Zone 2 command: {cmd_id} with params: {params}")
+        
+        if not self._client.available:
+            _LOG.warning(f"{self._client.name} is unavailable, rejecting {cmd_id}")
+            return StatusCodes.SERVICE_UNAVAILABLE
+        
+        try:
+            if cmd_id == ucapi.media_player.Commands.ON:
+                await self._client.zone2_power_on()
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.OFF:
+                await self._client.zone2_power_off()
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.TOGGLE:
+                await self._client.zone2_power_toggle()
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.VOLUME:
+                if params and "volume" in params:
+                    await self._client.zone2_set_volume_percent(float(params["volume"]))
+                    return StatusCodes.OK
+                return StatusCodes.BAD_REQUEST
+            
+            elif cmd_id == ucapi.media_player.Commands.VOLUME_UP:
+                await self._client.zone2_volume_up()
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.VOLUME_DOWN:
+                await self._client.zone2_volume_down()
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.MUTE_TOGGLE:
+                await self._client.zone2_mute_toggle()
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.MUTE:
+                await self._client.zone2_set_mute(True)
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.UNMUTE:
+                await self._client.zone2_set_mute(False)
+                return StatusCodes.OK
+            
+            elif cmd_id == ucapi.media_player.Commands.SELECT_SOURCE:
+                if params and "source" in params:
+                    await self._client.zone2_set_source(params["source"])
+                    return StatusCodes.OK
+                return StatusCodes.BAD_REQUEST
+            
+            else:
+                _LOG.warning(f"Unsupported zone 2 command: {cmd_id}")
+                return StatusCodes.NOT_IMPLEMENTED
+        
+        except Exception as e:
+            _LOG.error(f"Error handling zone 2 command {cmd_id}: {e}", exc_info=True)
+            return StatusCodes.SERVER_ERROR